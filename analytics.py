@@ -0,0 +1,184 @@
+# analytics.py — 리딩 기록 집계(오프라인 배치)
+# -------------------------------------------------
+# - history.py 의 SQLite 기록을 리딩 id 구간(chunk) 단위로 읽어
+#   카드 번호 배열에 대해 NumPy bincount 로 한꺼번에 집계
+#   · 카드별 뽑힌 횟수 / 역위 횟수(전체, 일별)
+#   · 역위 확률 설정(reversed_prob)별 실제 역위 비율
+#   · 스프레드 / 요약 포커스 인기
+# - 결과는 작은 JSON 롤업 파일 하나. 지난번 마지막 리딩 id 를 기억해 새 기록만 더함
+# - 앱은 롤업만 읽어 '오늘 많이 뽑힌 카드'를 즉시 표시(앱 쪽 함수는 NumPy 를 가져오지 않음)
+#
+#   python analytics.py                 # 새 기록만 반영
+#   python analytics.py --full          # 처음부터 다시 집계
+# -------------------------------------------------
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+from history import DEFAULT_DB
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_ROLLUPS = Path(os.environ.get("TAROT_ROLLUPS", DEFAULT_DB.parent / "rollups.json"))
+N_CARDS = 78
+CHUNK_READINGS = 200_000
+KEEP_DAYS = 30
+
+
+def empty_rollups() -> Dict[str, Any]:
+    return {
+        "version": 1,
+        "last_reading_id": 0,
+        "generated_at": None,
+        "readings": 0,
+        "cards": {"draws": [0] * N_CARDS, "reversed": [0] * N_CARDS},
+        "by_day": {},
+        "reversal_by_prob": {},
+        "spreads": {},
+        "focus": {},
+    }
+
+
+def load_rollups(path: Path = DEFAULT_ROLLUPS) -> Optional[Dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _add_counts(target: Dict[str, int], keys: "np.ndarray") -> None:
+    import numpy as np
+    values, counts = np.unique(keys, return_counts=True)
+    for v, n in zip(values.tolist(), counts.tolist()):
+        target[v] = target.get(v, 0) + n
+
+
+def _merge_array(current: List[int], delta: "np.ndarray") -> List[int]:
+    import numpy as np
+    return (np.asarray(current, dtype=np.int64) + delta).tolist()
+
+
+def aggregate(db_path: Path, rollups: Dict[str, Any], chunk: int = CHUNK_READINGS,
+              keep_days: int = KEEP_DAYS) -> Dict[str, Any]:
+    """rollups 에 last_reading_id 이후 기록을 더해 반환."""
+    import numpy as np
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    last_id = rollups["last_reading_id"]
+    max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM readings").fetchone()[0]
+
+    draws = np.zeros(N_CARDS, dtype=np.int64)
+    reversed_ = np.zeros(N_CARDS, dtype=np.int64)
+    by_day = rollups["by_day"]
+    by_prob = rollups["reversal_by_prob"]
+
+    while last_id < max_id:
+        hi = min(last_id + chunk, max_id)
+        meta = conn.execute(
+            "SELECT id, day, spread, COALESCE(focus, ''), COALESCE(reversed_prob, -1)"
+            " FROM readings WHERE id > ? AND id <= ? ORDER BY id", (last_id, hi),
+        ).fetchall()
+        rows = conn.execute(
+            "SELECT reading_id, card_idx, reversed FROM reading_cards"
+            " WHERE reading_id > ? AND reading_id <= ?", (last_id, hi),
+        ).fetchall()
+        last_id = hi
+        if not meta:
+            continue
+
+        ids = np.fromiter((m[0] for m in meta), dtype=np.int64, count=len(meta))
+        days = np.array([m[1] for m in meta])
+        probs = np.round(np.fromiter((m[4] for m in meta), dtype=np.float64, count=len(meta)), 2)
+        _add_counts(rollups["spreads"], np.array([m[2] for m in meta]))
+        _add_counts(rollups["focus"], np.array([m[3] for m in meta]))
+        rollups["readings"] += len(meta)
+        if not rows:
+            continue
+
+        arr = np.array(rows, dtype=np.int64)
+        rid, card, rev = arr[:, 0], arr[:, 1], arr[:, 2]
+        draws += np.bincount(card, minlength=N_CARDS)
+        reversed_ += np.bincount(card, weights=rev, minlength=N_CARDS).astype(np.int64)
+
+        # 카드 행 → 소속 리딩의 날짜/역위 확률
+        owner = np.searchsorted(ids, rid)
+        day_keys, day_code = np.unique(days[owner], return_inverse=True)
+        flat = day_code * N_CARDS + card
+        day_draws = np.bincount(flat, minlength=len(day_keys) * N_CARDS).reshape(-1, N_CARDS)
+        day_rev = np.bincount(flat, weights=rev, minlength=len(day_keys) * N_CARDS).reshape(-1, N_CARDS)
+        for k, day in enumerate(day_keys.tolist()):
+            slot = by_day.setdefault(day, {"draws": [0] * N_CARDS, "reversed": [0] * N_CARDS})
+            slot["draws"] = _merge_array(slot["draws"], day_draws[k])
+            slot["reversed"] = _merge_array(slot["reversed"], day_rev[k].astype(np.int64))
+
+        prob_keys, prob_code = np.unique(probs[owner], return_inverse=True)
+        prob_cards = np.bincount(prob_code, minlength=len(prob_keys))
+        prob_rev = np.bincount(prob_code, weights=rev, minlength=len(prob_keys))
+        for k, p in enumerate(prob_keys.tolist()):
+            key = "unknown" if p < 0 else f"{p:.2f}"
+            slot = by_prob.setdefault(key, {"cards": 0, "reversed": 0})
+            slot["cards"] += int(prob_cards[k])
+            slot["reversed"] += int(prob_rev[k])
+    conn.close()
+
+    rollups["cards"]["draws"] = _merge_array(rollups["cards"]["draws"], draws)
+    rollups["cards"]["reversed"] = _merge_array(rollups["cards"]["reversed"], reversed_)
+    for slot in by_prob.values():
+        slot["observed_ratio"] = round(slot["reversed"] / slot["cards"], 4) if slot["cards"] else 0.0
+    for day in sorted(by_day)[:-keep_days or None]:
+        del by_day[day]
+    rollups["last_reading_id"] = last_id
+    rollups["generated_at"] = time.time()
+    return rollups
+
+
+def top_cards(rollups: Dict[str, Any], day: Optional[str] = None, limit: int = 5) -> List[Dict[str, int]]:
+    """많이 뽑힌 카드 번호 상위 N(day 를 주면 그날만)."""
+    src = rollups["by_day"].get(day) if day else rollups["cards"]
+    if not src:
+        return []
+    draws = src["draws"]
+    order = sorted(range(len(draws)), key=lambda i: -draws[i])[:limit]
+    return [{"card_idx": i, "draws": draws[i], "reversed": src["reversed"][i]}
+            for i in order if draws[i] > 0]
+
+
+def write_rollups(rollups: Dict[str, Any], path: Path = DEFAULT_ROLLUPS) -> None:
+    """임시 파일에 쓰고 교체 → 앱이 반쯤 쓴 파일을 읽는 일이 없음."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(rollups, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="리딩 기록 집계 → 롤업 JSON")
+    ap.add_argument("--db", default=str(DEFAULT_DB))
+    ap.add_argument("--out", default=str(DEFAULT_ROLLUPS))
+    ap.add_argument("--chunk", type=int, default=CHUNK_READINGS, help="한 번에 읽을 리딩 수")
+    ap.add_argument("--keep-days", type=int, default=KEEP_DAYS, help="일별 롤업 보관 일수")
+    ap.add_argument("--full", action="store_true", help="기존 롤업을 무시하고 처음부터")
+    args = ap.parse_args()
+
+    if not Path(args.db).exists():
+        raise SystemExit(f"기록 DB가 없습니다: {args.db}")
+    rollups = None if args.full else load_rollups(Path(args.out))
+    t0 = time.perf_counter()
+    before = rollups["readings"] if rollups else 0
+    rollups = aggregate(Path(args.db), rollups or empty_rollups(), chunk=args.chunk, keep_days=args.keep_days)
+    write_rollups(rollups, Path(args.out))
+    print(f"집계 완료: 새 리딩 {rollups['readings'] - before}건 / 누적 {rollups['readings']}건 "
+          f"({time.perf_counter() - t0:.2f}s) → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
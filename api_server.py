@@ -0,0 +1,289 @@
+# api_server.py — 리딩 JSON/HTTP API (Streamlit UI와 별도 프로세스)
+# -------------------------------------------------
+# - 모바일 클라이언트용: 뽑기(draw) / 공개(reveal) / 요약(summarize)
+# - 리딩 텍스트는 reading.py, 카탈로그는 deck_registry.py 를 앱과 그대로 공유
+# - Tornado(Streamlit 의존성으로 이미 설치됨) 비동기 서버
+#   · HTTP/1.1 keep-alive 기본, gzip 응답 압축, GET 응답 ETag/304
+#   · 같은 요청의 응답(원본·gzip 바이트, ETag)은 LRU 캐시
+#     → 반복 요청은 직렬화/압축/해시 없이 바이트만 전송
+# - 카탈로그 파일이 바뀌면 재시작 없이 교체(catalog_watch.py)
+#   · 응답 캐시 키에 카탈로그 버전을 넣고, 교체되면 캐시를 비움
+#
+#   python api_server.py --port 8600 --processes 0   # 0 = CPU 코어 수만큼 fork
+#
+# 예)
+#   GET /v1/draw?spread=three_card&seed=42
+#   GET /v1/reveal?spread=three_card&cards=MAJOR_00_TheFool,CUPS_Ace&rev=01&focus=love
+#   GET /v1/summarize?spread=three_card&cards=MAJOR_00_TheFool,CUPS_Ace&rev=01&focus=love
+# -------------------------------------------------
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import tornado.ioloop
+import tornado.web
+from tornado.httpserver import HTTPServer
+from tornado.netutil import bind_sockets
+from tornado.process import fork_processes
+
+from card_lint import CardLinter
+from catalog_watch import Catalog, CatalogWatcher
+from deck_registry import DeckRegistry, Deck
+from reading import (
+    FOCUS_KEYS, CATEGORY_KEYS, display_name,
+    summarize_drawn, build_position_story, compose_fluent_summary,
+)
+
+BASE = Path(__file__).parent
+DATA_DIR = BASE / "data"
+
+REGISTRY = DeckRegistry(DATA_DIR / "decks.json", validate=CardLinter().validate)
+WATCHER = CatalogWatcher(REGISTRY, DATA_DIR, validate_combos=CardLinter().validate_combos)
+
+RESPONSE_CACHE_SIZE = 4096
+
+
+# 캐시되는 응답 단위: (원본 바이트, gzip 바이트, ETag). 캐시 금지 응답은 ETag 없음(None)
+Payload = Tuple[bytes, bytes, Optional[str]]
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _pack(obj: Any, etag: bool = True) -> Payload:
+    body = _dumps(obj)
+    tag = f'"{hashlib.sha1(body).hexdigest()}"' if etag else None
+    return body, gzip.compress(body, compresslevel=6, mtime=0), tag
+
+
+class ApiError(tornado.web.HTTPError):
+    """클라이언트 입력 오류 → 400 + JSON 메시지."""
+
+    def __init__(self, message: str, status_code: int = 400) -> None:
+        super().__init__(status_code, reason=None)
+        self.message = message
+
+
+# ========================= 요청 해석 =========================
+def _spread(key: str) -> Dict[str, Any]:
+    spreads = WATCHER.snapshot.spreads
+    if key not in spreads:
+        raise ApiError(f"unknown spread: {key}")
+    return spreads[key]
+
+
+def _resolve_cards(deck: Deck, spread_key: str, ids: str, rev: str) -> List[Dict[str, Any]]:
+    """cards=ID,ID,... 와 rev=0/1 비트열을 정/역위가 붙은 카드 사본 목록으로."""
+    card_ids = [c for c in ids.split(",") if c]
+    n = len(_spread(spread_key)["positions"])
+    if len(card_ids) != n:
+        raise ApiError(f"spread '{spread_key}' needs {n} cards, got {len(card_ids)}")
+    if len(set(card_ids)) != n:
+        raise ApiError("duplicate card id")
+    rev = rev or "0" * n
+    if len(rev) != n or set(rev) - {"0", "1"}:
+        raise ApiError("rev must be a 0/1 string with one digit per card")
+    cards = []
+    for card_id, bit in zip(card_ids, rev):
+        card = deck.by_id.get(card_id)
+        if card is None:
+            raise ApiError(f"unknown card id: {card_id}")
+        cards.append({**card, "is_reversed": bit == "1"})
+    return cards
+
+
+def _card_json(card: Dict[str, Any], focus: str) -> Dict[str, Any]:
+    blk = card["reversed" if card["is_reversed"] else "upright"]
+    return {
+        "id": card["id"],
+        "name": display_name(card),
+        "reversed": card["is_reversed"],
+        "text": blk.get(focus, ""),
+        "categories": {k: blk.get(k, "") for k in CATEGORY_KEYS if blk.get(k)},
+    }
+
+
+# ========================= 응답 생성(캐시) =========================
+# 첫 인자 version 은 캐시 키 전용: 카탈로그가 교체되면 옛 응답이 다시 나가지 않음
+@lru_cache(maxsize=4)
+def render_spreads(version: int) -> Payload:
+    return _pack(WATCHER.snapshot.spreads)
+
+
+def _draw(deck_key: str, locale: str, spread_key: str, seed: int,
+          allow_reversed: bool, reversed_prob: float) -> Dict[str, Any]:
+    deck = REGISTRY.get(deck_key, locale)
+    n = len(_spread(spread_key)["positions"])
+    rng = random.Random(seed)
+    drawn = rng.sample(range(len(deck.cards)), n)
+    ids = [deck.cards[i]["id"] for i in drawn]
+    rev = "".join("1" if allow_reversed and rng.random() < reversed_prob else "0" for _ in ids)
+    return {"spread": spread_key, "seed": seed, "cards": ids, "rev": rev}
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def render_draw(version: int, deck_key: str, locale: str, spread_key: str, seed: int,
+                allow_reversed: bool, reversed_prob: float) -> Payload:
+    """시드를 준 뽑기만(같은 시드 = 같은 결과). 시드 없는 뽑기는 _draw 를 바로 써서 캐시를 밀어내지 않음."""
+    return _pack(_draw(deck_key, locale, spread_key, seed, allow_reversed, reversed_prob))
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def render_reveal(version: int, deck_key: str, locale: str, spread_key: str, ids: str, rev: str, focus: str) -> Payload:
+    deck = REGISTRY.get(deck_key, locale)
+    cards = _resolve_cards(deck, spread_key, ids, rev)
+    spread = _spread(spread_key)
+    return _pack({
+        "spread": spread_key,
+        "positions": spread["positions"],
+        "cards": [_card_json(c, focus) for c in cards],
+        "story": build_position_story(cards, spread, focus=focus, locale=deck.locale),
+    })
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def render_summary(version: int, deck_key: str, locale: str, spread_key: str, ids: str, rev: str, focus: str) -> Payload:
+    deck = REGISTRY.get(deck_key, locale)
+    cards = _resolve_cards(deck, spread_key, ids, rev)
+    return _pack({
+        "spread": spread_key,
+        "fluent": compose_fluent_summary(cards, focus=focus, locale=deck.locale),
+        "summary": summarize_drawn(cards, WATCHER.snapshot.combo_matcher, deck.locale),
+    })
+
+
+def _clear_caches(catalog: Catalog) -> None:
+    for fn in (render_spreads, render_draw, render_reveal, render_summary):
+        fn.cache_clear()
+
+
+WATCHER.add_listener(_clear_caches)
+
+
+# ========================= 핸들러 =========================
+class BaseHandler(tornado.web.RequestHandler):
+    _payload: Optional[Payload] = None
+
+    def set_default_headers(self) -> None:
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+
+    def compute_etag(self) -> Optional[str]:
+        # 캐시된 응답은 미리 계산한 ETag 사용(매 요청 본문 해시 생략), 캐시 금지 응답은 ETag 없음
+        if self._payload is not None:
+            return self._payload[2]
+        return super().compute_etag()
+
+    def send_payload(self, payload: Payload) -> None:
+        self._payload = payload
+        body, gz, _ = payload
+        if "gzip" in self.request.headers.get("Accept-Encoding", "") and len(gz) < len(body):
+            self.set_header("Content-Encoding", "gzip")
+            body = gz
+        self.write(body)
+
+    def write_error(self, status_code: int, **kwargs: Any) -> None:
+        exc = kwargs.get("exc_info", (None, None, None))[1]
+        message = getattr(exc, "message", None) or getattr(exc, "log_message", None) or self._reason
+        self.finish(_dumps({"error": message}))
+
+    @property
+    def version(self) -> int:
+        return WATCHER.snapshot.version
+
+    def deck_args(self) -> Tuple[str, str]:
+        deck_key = self.get_argument("deck", REGISTRY.default_deck)
+        if deck_key not in REGISTRY.deck_keys():
+            raise ApiError(f"unknown deck: {deck_key}")
+        return deck_key, self.get_argument("locale", REGISTRY.default_locale)
+
+    def focus_arg(self) -> str:
+        focus = self.get_argument("focus", "love")
+        if focus not in FOCUS_KEYS:
+            raise ApiError(f"focus must be one of {FOCUS_KEYS}")
+        return focus
+
+    def reading_args(self) -> Tuple[str, str, str, str, str, str]:
+        deck_key, locale = self.deck_args()
+        return (deck_key, locale, self.get_argument("spread"), self.get_argument("cards"),
+                self.get_argument("rev", ""), self.focus_arg())
+
+
+class SpreadsHandler(BaseHandler):
+    def get(self) -> None:
+        self.send_payload(render_spreads(self.version))
+
+
+class DrawHandler(BaseHandler):
+    def get(self) -> None:
+        deck_key, locale = self.deck_args()
+        seed_arg: Optional[str] = self.get_argument("seed", None)
+        try:
+            reversed_prob = min(max(float(self.get_argument("reversed_prob", "0.5")), 0.0), 1.0)
+        except ValueError:
+            raise ApiError("reversed_prob must be a number")
+        allow_reversed = self.get_argument("allow_reversed", "1") not in ("0", "false")
+        spread_key = self.get_argument("spread")
+        if seed_arg is None:
+            # 시드 없는 뽑기는 매번 달라야 하므로 캐시 금지(응답 캐시·ETag 도 쓰지 않음)
+            seed = random.SystemRandom().randrange(2 ** 31)
+            self.set_header("Cache-Control", "no-store")
+            draw = _draw(deck_key, locale, spread_key, seed, allow_reversed, reversed_prob)
+            self.send_payload(_pack(draw, etag=False))
+            return
+        try:
+            seed = int(seed_arg)
+        except ValueError:
+            raise ApiError("seed must be an integer")
+        self.send_payload(render_draw(self.version, deck_key, locale, spread_key, seed,
+                                      allow_reversed, reversed_prob))
+
+
+class RevealHandler(BaseHandler):
+    def get(self) -> None:
+        self.send_payload(render_reveal(self.version, *self.reading_args()))
+
+
+class SummarizeHandler(BaseHandler):
+    def get(self) -> None:
+        self.send_payload(render_summary(self.version, *self.reading_args()))
+
+
+def make_app() -> tornado.web.Application:
+    return tornado.web.Application(
+        [
+            (r"/v1/spreads", SpreadsHandler),
+            (r"/v1/draw", DrawHandler),
+            (r"/v1/reveal", RevealHandler),
+            (r"/v1/summarize", SummarizeHandler),
+        ],
+        # 캐시 응답은 미리 압축해 두고, 오류 등 나머지만 실시간 압축
+        compress_response=True,
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="타로 리딩 JSON API")
+    ap.add_argument("--host", default="0.0.0.0")
+    ap.add_argument("--port", type=int, default=8600)
+    ap.add_argument("--processes", type=int, default=1, help="0 = CPU 코어 수")
+    args = ap.parse_args()
+
+    sockets = bind_sockets(args.port, address=args.host)
+    if args.processes != 1:
+        fork_processes(args.processes)
+    REGISTRY.get()  # 기본 덱을 미리 로딩해 첫 요청 지연 제거
+    WATCHER.start()  # 스레드는 fork 뒤에(프로세스마다 하나)
+    server = HTTPServer(make_app(), xheaders=True)
+    server.add_sockets(sockets)
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,51 +5,98 @@
 # - 선택 후 공개: 카드 이미지/명칭/정·역위/카테고리별 의미
 # - 규칙형 종합 요약 + 한두 줄 자연어 요약
 # - 데이터: ./data/cards.json, ./data/spreads.json, (선택) ./data/combos.json
+#   · 파일을 고치면 재시작 없이 몇 초 안에 반영(catalog_watch.py)
 # - 이미지: ./cards/{id}.jpg, 뒷면: ./assets/card_back.png
+#   · 전송용 WebP/JPEG 파일은 ./static/img 에 한 번만 만들어 정적 서빙(.streamlit/config.toml, image_delivery.py)
 # -------------------------------------------------
 
-import json
+import atexit
+import hashlib
 import random
+import threading
+import time
+import uuid
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Optional
+from zoneinfo import ZoneInfo
 
 from io import BytesIO
 import math
 
+# 첫 화면 시간 측정 기준(아래 무거운 모듈 가져오기 포함)
+_SCRIPT_T0 = time.perf_counter()
+
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 from PIL import Image
 
+from deck_registry import DeckRegistry, Deck
+from catalog_watch import CatalogWatcher
+from card_lint import CardLinter, canonical_index
+from spread_layout import (
+    spread_canvas, spread_canvas_width, spread_card_width, spread_slots, spread_jpeg, fitted_front, front_scaled,
+    front_jpeg,
+)
+from image_delivery import ImageStore, Tier, TIERS, Variants, picture_html, pick_tier, wants_save_data
+from prefetch import Prefetcher
+from permalink import encode_reading, decode_reading, decode_spread
+from history import HistoryStore
+from analytics import DEFAULT_ROLLUPS, load_rollups, top_cards
+from warmup import Warmup, derivative_tasks, warm_templates
+from reading import (
+    FOCUS_KEYS, FOCUS_LABELS, display_name,
+    summarize_drawn, build_position_story, compose_fluent_summary,
+    card_piece, normalize_positions, build_position_line, summarize_pieces, compose_fluent_from_pieces,
+    build_position_stories,
+)
+
+_IMPORT_MS = (time.perf_counter() - _SCRIPT_T0) * 1000
+
 # ========================= 설정 =========================
 APP_TITLE = "클릭형 타로 리딩"
-CARD_BACK_PATH = Path("assets/card_back.png")  # 뒷면 공용 이미지
-CARDS_DIR = Path("cards")                      # 각 카드 앞면 이미지 폴더
 DATA_DIR = Path("data")
-CARDS_JSON = DATA_DIR / "cards.json"           # 카드 메타/의미 데이터
-COMBOS_JSON = DATA_DIR / "combos.json"         # 조합 규칙 데이터(선택)
+DECKS_JSON = DATA_DIR / "decks.json"           # 덱(아트)/언어별 카드 데이터 등록
 
 GRID_COLS = 13
+DEFAULT_FRONT_SIZE = 200                       # 앞면 이미지 크기 슬라이더 기본값(워밍업 기준)
+BACK_THUMB_WIDTHS = range(120, 221, 10)        # 뒷면 썸네일 너비 슬라이더 범위
+DEFAULT_BACK_THUMB = 160
 DEFAULT_REVERSED_PROB = 0.5
+DAILY_TZ = ZoneInfo("Asia/Seoul")              # '오늘의 카드'가 바뀌는 기준 시간대
+DAILY_SPREAD = "one_card"
+DAILY_REVERSED_PROB = 0.5                      # 오늘의 카드 정/역위는 해시로 반반
 
 # ========================= 캐시/로딩 =========================
-@st.cache_data(show_spinner=False)
-def load_cards() -> List[Dict[str, Any]]:
-    with open(CARDS_JSON, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-@st.cache_data(show_spinner=False)
-def load_combos() -> List[Dict[str, Any]]:
-    if COMBOS_JSON.exists():
-        with open(COMBOS_JSON, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+@st.cache_resource(show_spinner=False)
+def get_registry() -> DeckRegistry:
+    """프로세스 전체에서 공유하는 덱 레지스트리(덱은 처음 쓰일 때 로딩)."""
+    return DeckRegistry(DECKS_JSON, validate=CardLinter().validate)
+
+def get_deck(deck_key: str, locale: str) -> Deck:
+    return get_registry().get(deck_key, locale)
 
 @st.cache_resource(show_spinner=False)
-def get_back_image() -> Image.Image:
-    return Image.open(CARD_BACK_PATH)
+def get_catalog_watcher() -> CatalogWatcher:
+    """카드/스프레드/콤보/템플릿 파일 감시(프로세스당 1개). 바뀌면 백그라운드에서 다시 만들어 교체."""
+    watcher = CatalogWatcher(get_registry(), DATA_DIR, validate_combos=CardLinter().validate_combos)
+    watcher.start()
+    atexit.register(watcher.stop)
+    return watcher
+
+@st.cache_resource(show_spinner=False)
+def get_back_master(back_path: Path) -> Image.Image:
+    """뒷면 원본(약 830×1440 PNG)은 한 번만 디코드하고, 썸네일 최대 너비의 2배로 줄여 보관."""
+    img = Image.open(back_path).convert("RGBA")
+    limit = max(BACK_THUMB_WIDTHS) * 2
+    if img.width > limit:
+        img = img.resize((limit, int(img.height * limit / img.width)), Image.LANCZOS)
+    return img
+
 @st.cache_resource(show_spinner=False)
-def get_back_thumb(width: int) -> Image.Image:
+def get_back_thumb(width: int, back_path: Path) -> Image.Image:
     """뒷면 이미지를 지정 너비로 1회만 리사이즈하여 캐시."""
-    img = Image.open(CARD_BACK_PATH).convert("RGBA")
+    img = get_back_master(back_path)
     w, h = img.size
     if w > width:  # 필요할 때만 축소
         ratio = width / float(w)
@@ -57,315 +104,344 @@ def get_back_thumb(width: int) -> Image.Image:
     return img
 
 @st.cache_resource(show_spinner=False)
-def get_back_thumb_bytes(width: int) -> bytes:
-    """streamlit 렌더링 부담을 줄이기 위해 메모리 바이트로 캐시."""
-    img = get_back_thumb(width)
+def get_back_thumb_bytes(width: int, back_path: Path) -> bytes:
+    """정적 서빙이 꺼져 있을 때(st.image) 쓰는 뒷면 썸네일 바이트."""
+    img = get_back_thumb(width, back_path)
     buf = BytesIO()
-    # PNG 그대로 써도 되고, 더 가볍게 하려면 WebP:
-    # img.save(buf, format="WEBP", quality=85, method=6)
     img.save(buf, format="PNG", optimize=True)
     return buf.getvalue()
 
 @st.cache_resource(show_spinner=False)
-def get_front_image(card_id: str) -> Image.Image:
-    path = CARDS_DIR / f"{card_id}.jpg"
-    return Image.open(path)
-
-# ========================= 종합 해석 로직 =========================
-# ========================= 종합 해석 로직 =========================
-CATEGORY_KEYS = ["general", "love", "career", "finance", "health", "advice"]
-
-def summarize_drawn(cards: List[Dict[str, Any]]) -> Dict[str, str]:
-    """간단 규칙 기반 요약 + (있다면) 콤보 룰 적용"""
-    if not cards:
-        return {k: "" for k in CATEGORY_KEYS}
-
-    majors = sum(1 for c in cards if c.get("arcana") == "major")
-    reversed_cnt = sum(1 for c in cards if c.get("is_reversed"))
-    suits = {"wands": 0, "cups": 0, "swords": 0, "pentacles": 0}
-    for c in cards:
-        s = c.get("suit")
-        if s in suits:
-            suits[s] += 1
-
-    def cat_text(cat: str) -> str:
-        lines = []
-        for c in cards:
-            blk = c["reversed" if c.get("is_reversed") else "upright"]
-            txt = blk.get(cat, "")
-            if txt:
-                lines.append(txt)
-        return " / ".join(lines[:3])
-
-    combos = load_combos()
-    combo_msgs = {k: [] for k in CATEGORY_KEYS}
-    # 콤보 패턴 매칭은 name_en → 없으면 name_kr → 없으면 id
-    names_in_order = [c.get("name_en") or c.get("name_kr") or c.get("id") for c in cards]
-
-    for rule in combos:
-        pattern: List[str] = rule.get("pattern", [])
-        if not pattern:
-            continue
-        try:
-            start = 0
-            for token in pattern:
-                idx = names_in_order.index(token, start)
-                start = idx + 1
-            # 순서대로 전부 발견 → 룰 트리거
-            for cat in CATEGORY_KEYS:
-                msg = rule.get(cat) or rule.get("general")
-                if msg:
-                    combo_msgs[cat].append(msg)
-        except ValueError:
-            continue
-
-    header = (
-        f"메이저:{majors} / 마이너:{len(cards)-majors}, "
-        f"역위:{reversed_cnt}, "
-        f"슈트(완드/컵/소드/펜타클): {suits['wands']}/{suits['cups']}/{suits['swords']}/{suits['pentacles']}"
-    )
+def get_image_store() -> ImageStore:
+    """전송용 이미지 파일 저장소(프로세스당 1개, ./static/img)."""
+    return ImageStore()
 
-    summary = {k: cat_text(k) for k in CATEGORY_KEYS}
-    for k in CATEGORY_KEYS:
-        if combo_msgs[k]:
-            summary[k] = (summary[k] + " | " if summary[k] else "") + " | ".join(combo_msgs[k][:2])
-    summary["general"] = header + ("\n" + summary["general"] if summary["general"] else "")
-    return summary
-
-
-# ---- 여기를 전역(함수 밖)으로 꼭 둬야 함! ----
-def _pick_text_from_card(card: Dict[str, Any], focus: str) -> str:
-    """포커스(연애/직업/금전/건강/조언) 우선으로 카드 한 장에서 한 줄 선택"""
-    blk = card["reversed" if card.get("is_reversed") else "upright"]
-    order_map = {
-        "love":   ["love", "advice", "general", "career", "finance", "health"],
-        "career": ["career", "advice", "general", "finance", "love", "health"],
-        "finance":["finance","advice","general","career","love","health"],
-        "health": ["health","advice","general","career","finance","love"],
-        "advice": ["advice","general","career","finance","health","love"],
-    }
-    order = order_map.get(focus, ["advice","general","career","finance","health","love"])
-    for k in order:
-        t = (blk.get(k) or "").strip()
-        if t:
-            return t
-    return ""
-
-
-def build_position_story(picked: List[Dict[str, Any]], current_spread: Dict[str, Any], focus: str) -> str:
-    """
-    positions 항목이
-      - ["과거","현재","미래"] 같은 '문자열 리스트' 이거나
-      - [{"title":"과거","role":"past"}, ...] 같은 '딕셔너리 리스트'
-    둘 다 동작하도록 방어적으로 처리.
-    """
-    # 1) positions 추출 + 정규화
-    raw_positions = (current_spread or {}).get("positions", []) or []
-    pos_defs: List[Dict[str, Any]] = []
-    for p in raw_positions:
-        if isinstance(p, dict):
-            pos_defs.append(p)
-        elif isinstance(p, str):
-            pos_defs.append({"title": p})
-        else:
-            pos_defs.append({"title": f"포지션 {len(pos_defs)+1}"})
-
-    # 만약 포지션 개수가 카드보다 적으면 기본 타이틀로 채워줌
-    if len(pos_defs) < len(picked):
-        for i in range(len(pos_defs), len(picked)):
-            pos_defs.append({"title": f"포지션 {i+1}"})
-
-    # 2) 라인 작성
-    lines = []
-    for i, card in enumerate(picked):
-        pos = pos_defs[i] if i < len(pos_defs) else {}
-        title = pos.get("title") or f"포지션 {i+1}"
-        role  = (pos.get("role") or "").lower()  # past/present/future/advice/obstacle/outcome...
-
-        name_kr = card.get("name_kr")
-        name_en = card.get("name_en") or card.get("name") or card.get("id")
-        display = f"{name_kr} ({name_en})" if (name_kr and name_en and name_en != name_kr) else (name_kr or name_en)
-
-        t = _pick_text_from_card(card, focus=focus)
-        if not t:
-            t = "지금은 균형과 조율이 필요한 흐름으로 보여요." if not card.get("is_reversed") else "먼저 방향을 가다듬고 정리하면 좋아 보여요."
-
-        head = {
-            "past":    "과거 흐름을 보면, ",
-            "present": "현재 상황에서는, ",
-            "future":  "앞으로의 흐름은, ",
-            "advice":  "조언으로는, ",
-            "obstacle":"장애/주의 포인트로는, ",
-            "outcome": "결과적으로, ",
-        }.get(role, "")
-
-        tail = "" if t.endswith(("요.", "요!", "요?")) else " 같아요."
-        ori = "역위" if card.get("is_reversed") else "정위"
-        meta = f" (*{ori}*)"
-
-        lines.append(f"**{i+1}. {title} — {display}**{meta}\n- {head}{t}{tail}")
-
-    return "\n\n".join(lines)# ---- 여기까지가 전역 정의! ----
-
-
-def compose_fluent_summary(cards: List[Dict[str, Any]], focus: str = "love") -> str:
-    """정/역위·슈트·메이저 비율 기반으로 1~2문장 자연어 요약."""
-    n = len(cards)
-    majors = sum(1 for c in cards if c.get("arcana") == "major")
-    reversed_cnt = sum(1 for c in cards if c.get("is_reversed"))
-    suits = {"wands":0, "cups":0, "swords":0, "pentacles":0}
-    for c in cards:
-        s = c.get("suit")
-        if s in suits:
-            suits[s] += 1
-
-    mood = []
-    if majors >= max(1, n//2): mood.append("큰 전환점")
-    if reversed_cnt >= max(1, n//3): mood.append("조정이 필요한 신호")
-    if suits["wands"] >= 2: mood.append("열정과 실행력")
-    if suits["cups"]  >= 2: mood.append("감정과 관계")
-    if suits["swords"]>= 2: mood.append("사고와 판단")
-    if suits["pentacles"]>=2: mood.append("현실과 안정")
-    mood_txt = "와 ".join(mood) if mood else "균형"
-
-    # 포커스 카테고리에서 상위 1~2개 문장만 뽑아 연결
-    lines = []
-    for c in cards:
-        blk = c["reversed" if c.get("is_reversed") else "upright"]
-        t = (blk.get(focus) or "").strip()
-        if t:
-            lines.append(t)
-    lines = lines[:2]
+def back_variants(width: int, back_path: Path, tier: Tier) -> Variants:
+    """그리드 뒷면 썸네일 전송 파일(너비·품질 단계별로 한 번만 인코딩)."""
+    return get_image_store().variants(("back", str(back_path), width),
+                                      lambda d: get_back_thumb(width * d, back_path), tier)
 
-    first = f"지금 흐름은 **{mood_txt}** 쪽으로 기울어 보입니다."
-    second = " ".join(lines).replace("  ", " ").strip()
-    return (first + (" " + second if second else "")).strip()
+def show_picture(variants: Variants, width: int, alt: str = "", caption: Optional[str] = None) -> None:
+    st.markdown(picture_html(variants, width, alt, caption), unsafe_allow_html=True)
 
-def compose_fluent_summary(cards: List[Dict[str, Any]], focus: str = "love") -> str:
-    """정/역위·슈트·메이저 비율 기반으로 1~2문장 자연어 요약."""
+@st.cache_resource(show_spinner=False)
+def get_history() -> HistoryStore:
+    """완료된 리딩 기록용 저장소(프로세스당 1개, 쓰기는 백그라운드 스레드)."""
+    store = HistoryStore()
+    atexit.register(store.close)
+    return store
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_rollups_cached(mtime: float) -> Optional[Dict[str, Any]]:
+    # analytics.py 가 파일을 교체하면 mtime 이 바뀌어 다시 읽음
+    return load_rollups(DEFAULT_ROLLUPS)
+
+def get_rollups() -> Optional[Dict[str, Any]]:
+    try:
+        return load_rollups_cached(DEFAULT_ROLLUPS.stat().st_mtime)
+    except FileNotFoundError:
+        return None
 
-    def _pick_text_from_card(card: Dict[str, Any], focus: str) -> str:
-        """
-        카드 1장의 텍스트를 포커스(연애/직업/금전/건강/조언) 우선으로 고르고,
-        없으면 다른 카테고리로 유연하게 폴백.
-        """
-        blk = card["reversed" if card.get("is_reversed") else "upright"]
-        order_map = {
-            "love": ["love", "advice", "general", "career", "finance", "health"],
-            "career": ["career", "advice", "general", "finance", "love", "health"],
-            "finance": ["finance", "advice", "general", "career", "love", "health"],
-            "health": ["health", "advice", "general", "career", "finance", "love"],
-            "advice": ["advice", "general", "career", "finance", "health", "love"],
-        }
-        order = order_map.get(focus, ["advice", "general", "career", "finance", "health", "love"])
-        for k in order:
-            t = (blk.get(k) or "").strip()
-            if t:
-                return t
-        return ""
-
-    def build_position_story(picked: List[Dict[str, Any]], current_spread: Dict[str, Any], focus: str) -> str:
-        """
-        스프레드의 positions 순서대로 카드 해석을 1~2문장으로 생성.
-        spreads.json 예시:
-        {
-          "three_cards_ppf": {
-            "name": "3장 (과거-현재-미래)",
-            "positions": [
-              {"title":"과거","role":"past"},
-              {"title":"현재","role":"present"},
-              {"title":"미래","role":"future"}
-            ]
-          }
-        }
-        role이 없어도 title만으로 동작.
-        """
-        pos_defs = current_spread.get("positions", [])
-        lines = []
-        for i, card in enumerate(picked):
-            pos = pos_defs[i] if i < len(pos_defs) else {}
-            title = pos.get("title") or f"포지션 {i + 1}"
-            role = (pos.get("role") or "").lower()  # past/present/future/advice/obstacle/outcome...
-
-            # 카드 표시명
-            name_kr = card.get("name_kr")
-            name_en = card.get("name_en") or card.get("name") or card.get("id")
-            display = f"{name_kr} ({name_en})" if (name_kr and name_en and name_en != name_kr) else (name_kr or name_en)
-
-            # 포커스 기준 한 줄
-            t = _pick_text_from_card(card, focus=focus)
-            if not t:
-                t = "지금은 균형과 조율이 필요한 흐름으로 보여요." if not card.get("is_reversed") else "먼저 방향을 가다듬고 정리하면 좋아 보여요."
-
-            # role별 자연스러운 머리말
-            head = {
-                "past": "과거 흐름을 보면, ",
-                "present": "현재 상황에서는, ",
-                "future": "앞으로의 흐름은, ",
-                "advice": "조언으로는, ",
-                "obstacle": "장애/주의 포인트로는, ",
-                "outcome": "결과적으로, ",
-            }.get(role, "")
-
-            tail = "" if t.endswith(("요.", "요!", "요?")) else " 같아요."
-            ori = "역위" if card.get("is_reversed") else "정위"
-            meta = f" (*{ori}*)"  # 정/역위 표기
-
-            lines.append(f"**{i + 1}. {title} — {display}**{meta}\n- {head}{t}{tail}")
-
-        return "\n\n".join(lines)
-
-    n = len(cards)
-    majors = sum(1 for c in cards if c.get("arcana") == "major")
-    reversed_cnt = sum(1 for c in cards if c.get("is_reversed"))
-    suits = {"wands": 0, "cups": 0, "swords": 0, "pentacles": 0}
-    for c in cards:
-        s = c.get("suit")
-        if s in suits:
-            suits[s] += 1
-
-    mood = []
-    if majors >= max(1, n // 2):
-        mood.append("큰 전환점")
-    if reversed_cnt >= max(1, n // 3):
-        mood.append("조정이 필요한 신호")
-    if suits["wands"] >= 2:
-        mood.append("열정과 실행력")
-    if suits["cups"] >= 2:
-        mood.append("감정과 관계")
-    if suits["swords"] >= 2:
-        mood.append("사고와 판단")
-    if suits["pentacles"] >= 2:
-        mood.append("현실과 안정")
-
-    mood_txt = "와 ".join(mood) if mood else "균형"
-
-    # 포커스 카테고리에서 상위 1~2개 문장만 뽑아 연결
-    lines = []
+@st.cache_resource(show_spinner=False)
+def get_prefetcher() -> Prefetcher:
+    """앞면 미리 만들기용 스레드 풀(프로세스당 1개, 세션끼리 공유)."""
+    prefetcher = Prefetcher()
+    atexit.register(prefetcher.shutdown)
+    return prefetcher
+
+def front_args(deck: Deck, c: Dict[str, Any], width: int) -> Tuple[str, int, int]:
+    return str(deck.image_path(c["id"])), width, 180 if c.get("is_reversed") else 0
+
+def front_variants(path: str, width: int, rotate: int, tier: Tier) -> Variants:
+    """카드 패널용 앞면 전송 파일(표시 너비 × 배율, 정/역위)."""
+    return get_image_store().variants(("front", path, width, rotate),
+                                      lambda d: front_scaled(path, width * d, rotate), tier)
+
+def image_densities() -> Tuple[int, ...]:
+    """이번 rerun 에 만들 배율(st.image 로 보낼 때는 1배율만)."""
+    return TIER.densities if STATIC_IMAGES else (1,)
+
+def prefetch_fronts(deck: Deck, cards: List[Dict[str, Any]], width: int, layout: bool) -> None:
+    """고른 카드의 앞면을 지금 보기 방식·크기·품질 단계로 미리 만들기 시작(이미 있으면 곧바로 끝남)."""
+    prefetcher = get_prefetcher()
     for c in cards:
+        if layout:
+            for d in image_densities():
+                prefetcher.submit(fitted_front, str(deck.image_path(c["id"])), spread_card_width(width) * d)
+        elif STATIC_IMAGES:
+            prefetcher.submit(front_variants, *front_args(deck, c, width), TIER)
+        else:
+            prefetcher.submit(front_jpeg, *front_args(deck, c, width))
+
+# ========================= 렌더링 =========================
+def render_card_panel(deck: Deck, i: int, c: Dict[str, Any], width: int, show_image: bool = True) -> None:
+    """공개된 카드 1장: 이름/정·역위, 앞면 이미지, 카테고리 탭."""
+    with st.container(border=True):
+        st.markdown(f"**{i}. {display_name(c)}**  —  {'역위' if c.get('is_reversed') else '정위'}")
+        if show_image:
+            # 미리 만드는 중이면 그 결과를 기다림
+            if STATIC_IMAGES:
+                show_picture(get_prefetcher().get(front_variants, *front_args(deck, c, width), TIER),
+                             width, alt=display_name(c))
+            else:
+                st.image(get_prefetcher().get(front_jpeg, *front_args(deck, c, width)))
+
+        # 개요 탭 제거 → 5탭만 유지
+        tabs = st.tabs([FOCUS_LABELS[k] for k in FOCUS_KEYS])
         blk = c["reversed" if c.get("is_reversed") else "upright"]
-        t = (blk.get(focus) or "").strip()
-        if t:
-            lines.append(t)
-    lines = lines[:2]
-    first = f"지금 흐름은 **{mood_txt}** 쪽으로 기울어 보입니다."
-    second = " ".join(lines).replace("  ", " ").strip()
-    return (first + (" " + second if second else "")).strip()
+        for tab, k in zip(tabs, FOCUS_KEYS):
+            with tab: st.write(blk.get(k, ""))
+
+
+def render_spread_view(deck: Deck, cards: List[Dict[str, Any]], spread: Dict[str, Any],
+                       n_positions: int, width: int) -> None:
+    """공개된 카드 전체를 스프레드 배치도 이미지 1장으로(전송 파일은 카드·배치·크기·품질 단계별로 한 번만)."""
+    card_w = spread_card_width(width)
+    paths = [str(deck.image_path(c["id"])) for c in cards]
+    revs = [bool(c.get("is_reversed")) for c in cards]
+    prefetcher = get_prefetcher()
+    for path in paths:  # 미리 만드는 중인 축소본은 끝나길 기다려 같은 디코드를 두 번 하지 않음
+        for d in image_densities():
+            prefetcher.get(fitted_front, path, card_w * d)
+    n = max(n_positions, len(cards))
+    if not STATIC_IMAGES:
+        st.image(spread_jpeg(tuple(paths), tuple(revs), spread_slots(spread, n), card_w))
+        return
+    variants = get_image_store().variants(
+        ("spread", tuple(paths), tuple(revs), spread_slots(spread, n), card_w),
+        lambda d: spread_canvas(paths, revs, spread, card_w * d, n), TIER)
+    show_picture(variants, spread_canvas_width(spread, n, card_w), alt=spread.get("name", ""))
+
+
+def render_reading(story_md: str, fluent: str, summary: Dict[str, str]) -> None:
+    """포지션별 스토리 + 종합 해석(한두 줄 요약, 상세 요약)."""
+    # ===== 포지션별 스토리 =====
+    st.divider()
+    st.subheader("📜 포지션별 스토리")
+    st.markdown(story_md)
+
+    # ===== 종합 해석 =====
+    st.divider()
+    st.subheader("🧩 종합 해석")
+
+    # 한두 줄 자연어 요약
+    st.markdown("**요약(한두 줄)**")
+    st.write(fluent)
+
+    # 상세 요약(기존)
+    with st.expander("요약 보기", expanded=True):
+        st.markdown(
+            f"""
+            **종합 개요**  
+            {summary.get('general','')}
+
+            **연애**: {summary.get('love','')}
+
+            **직업**: {summary.get('career','')}
+
+            **금전**: {summary.get('finance','')}
+
+            **건강**: {summary.get('health','')}
+
+            **조언**: {summary.get('advice','')}
+            """
+        )
+
+# ========================= 공유 링크 =========================
+def reading_token(spread_key: str, cards: List[Dict[str, Any]]) -> Optional[str]:
+    """공유 토큰(스프레드 code + 표준 78장 번호). code 가 없거나 범위를 넘으면 None."""
+    code = SPREADS[spread_key].get("code")
+    idxs = [canonical_index(c) for c in cards]
+    if not isinstance(code, int) or None in idxs:
+        return None
+    try:
+        return encode_reading(code, idxs, [bool(c.get("is_reversed")) for c in cards])
+    except ValueError:
+        return None
+
+def reading_key(spread_key: str, cards: List[Dict[str, Any]]) -> str:
+    """기록 중복 방지 키: 공유 토큰, 없으면 스프레드 + 카드 id·정/역위."""
+    return reading_token(spread_key, cards) or ":".join(
+        [spread_key, *(c["id"] + ("~R" if c.get("is_reversed") else "") for c in cards)])
+
+def render_share_link(spread_key: str, cards: List[Dict[str, Any]]) -> None:
+    token = reading_token(spread_key, cards)
+    if token is None:
+        st.caption("이 스프레드는 공유 링크를 만들 수 없습니다(spreads.json 에 code 필요).")
+        return
+    st.markdown(f"🔗 [이 리딩 공유하기](?r={token})  `{token}`")
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def render_snapshot(token: str, deck_key: str, locale: str, focus: str,
+                    catalog_version: int) -> Dict[str, Any]:
+    """토큰 → 공개 화면에 필요한 결과 전부(배치도 이미지 제외). 인기 토큰은 캐시에서 바로 나감.
+    catalog_version 은 캐시 키용: 카탈로그가 교체되면 새로 만듦."""
+    deck = get_deck(deck_key, locale)
+    code = decode_spread(token)
+    spread_key = next((k for k, sp in SPREADS.items() if sp.get("code") == code), None)
+    if spread_key is None:
+        raise ValueError("알 수 없는 스프레드")
+    spread = SPREADS[spread_key]
+    _, idxs, revs = decode_reading(token, len(spread["positions"]))
+    if any(i not in deck.by_canonical for i in idxs):
+        raise ValueError("이 덱에 없는 카드")
+    cards = [{**deck.by_canonical[i], "is_reversed": r} for i, r in zip(idxs, revs)]
+    return {
+        "spread_key": spread_key,
+        "cards": cards,
+        "story": build_position_story(cards, spread, focus=focus, locale=locale),
+        "fluent": compose_fluent_summary(cards, focus=focus, locale=locale),
+        "summary": summarize_drawn(cards, CATALOG.combo_matcher, deck.locale),
+    }
+
+def log_reading(deck: Deck, spread_key: str, cards: List[Dict[str, Any]], focus: str,
+                reversed_prob: Optional[float], dedupe_key: str) -> None:
+    """완료된 리딩을 기록 큐에 넣음(같은 리딩의 rerun 은 한 번만)."""
+    if st.session_state.get("logged_reading") == dedupe_key:
+        return
+    st.session_state.logged_reading = dedupe_key
+    get_history().record({
+        "started_at": st.session_state.get("started_at"),
+        "day": today_str(),
+        "spread": spread_key,
+        "focus": focus,
+        "deck": deck.key,
+        "locale": deck.locale,
+        "reversed_prob": reversed_prob,
+        # 표준 78장 번호: cards.json 순서가 바뀌거나 덱마다 달라도 과거 통계와 섞이지 않음
+        "cards": [(canonical_index(c), bool(c.get("is_reversed"))) for c in cards
+                  if canonical_index(c) is not None],
+        "token": dedupe_key,
+    })
+
+# ========================= 카드별 즉시 공개 =========================
+# 고를 때마다 그 카드의 조각(요약용 값)·포지션 문장을 한 번만 만들어 세션에 보관하고,
+# 이후 rerun 에서는 보관된 조각을 이어 붙이기만 한다(앞면은 프로세스 공용 캐시).
+def get_pick_entry(deck: Deck, c: Dict[str, Any]) -> Dict[str, Any]:
+    cache: Dict[str, Dict[str, Any]] = st.session_state.setdefault("pick_cache", {})
+    entry = cache.get(c["id"])
+    if entry is None or entry["piece"]["reversed"] != bool(c.get("is_reversed")):
+        entry = {"card": c, "piece": card_piece(c), "lines": {}}
+        cache[c["id"]] = entry
+    return entry
+
+def position_line(entry: Dict[str, Any], i: int, pos: Dict[str, Any], focus: str) -> str:
+    line = entry["lines"].get((i, focus))
+    if line is None:
+        line = entry["lines"][(i, focus)] = build_position_line(i, entry["piece"], pos, focus, locale)
+    return line
+
+def prune_pick_cache(selected_ids: List[str]) -> None:
+    cache = st.session_state.get("pick_cache", {})
+    for card_id in [k for k in cache if k not in selected_ids]:
+        del cache[card_id]
+
+# ========================= 오늘의 카드 =========================
+# 1장 리딩은 (카드 78 × 정/역 2) × 포커스 5 = 780가지 결과뿐이므로
+# 날짜별로 한 번만 전부 만들어 두고, 사용자는 해시로 배정된 칸을 읽기만 한다.
+def today_str() -> str:
+    return datetime.now(DAILY_TZ).date().isoformat()
+
+def daily_assignment(user_key: str, day: str, n_cards: int, allow_reversed: bool) -> Tuple[int, bool]:
+    """(날짜, 사용자) 해시로 오늘의 카드 번호와 정/역위를 결정(셔플 없음)."""
+    h = int.from_bytes(hashlib.sha256(f"{day}:{user_key}".encode("utf-8")).digest()[:8], "big")
+    slot = h % (n_cards * 2)
+    return slot // 2, allow_reversed and bool(slot % 2)
+
+def build_daily_table(deck: Deck, spread: Dict[str, Any]) -> Dict[Tuple[int, bool], Dict[str, Any]]:
+    table: Dict[Tuple[int, bool], Dict[str, Any]] = {}
+    for idx, card in enumerate(deck.cards):
+        for rev in (False, True):
+            c = {**card, "is_reversed": rev}
+            table[(idx, rev)] = {
+                "card": c,
+                "summary": summarize_drawn([c], CATALOG.combo_matcher, deck.locale),
+                "fluent": {f: compose_fluent_summary([c], focus=f, locale=deck.locale) for f in FOCUS_KEYS},
+            }
+    # 포지션 스토리 780건은 템플릿 엔진 일괄 API로 한 번에
+    keys = [(k, f) for k in table for f in FOCUS_KEYS]
+    stories = build_position_stories((([table[k]["card"]], spread, f) for k, f in keys), locale=deck.locale)
+    for (k, f), story in zip(keys, stories):
+        table[k].setdefault("story", {})[f] = story
+    return table
+
+@st.cache_resource(show_spinner=False)
+def get_daily_store() -> Dict[str, Any]:
+    """프로세스 공용 저장소: 날짜나 카탈로그 버전이 바뀌면 표를 통째로 버림."""
+    return {"day": None, "tables": {}, "lock": threading.Lock()}
+
+def get_daily_table(deck_key: str, locale: str, spread: Dict[str, Any]) -> Dict[Tuple[int, bool], Dict[str, Any]]:
+    store = get_daily_store()
+    day = today_str()
+    with store["lock"]:
+        if store["day"] != (day, CATALOG.version):
+            store["day"] = (day, CATALOG.version)
+            store["tables"] = {}
+        table = store["tables"].get((deck_key, locale))
+        if table is None:
+            table = build_daily_table(get_deck(deck_key, locale), spread)
+            store["tables"][(deck_key, locale)] = table
+    return table
+
+# ========================= 워밍업 =========================
+@st.cache_resource(show_spinner=False)
+def get_warmup() -> Warmup:
+    return Warmup()
+
+def warmup_tasks() -> List[Tuple[str, Any]]:
+    """기본 덱·기본 크기 기준으로 미리 채울 캐시들(첫 화면 뒤 백그라운드)."""
+    deck = get_deck(registry.default_deck, registry.default_locale)
+    standard = TIERS["standard"]
+    if STATIC_IMAGES:
+        tasks = derivative_tasks(deck, SPREADS, [spread_card_width(DEFAULT_FRONT_SIZE) * d for d in standard.densities])
+        tasks.append(("뒷면 썸네일", lambda: [back_variants(w, deck.back_path, standard) for w in BACK_THUMB_WIDTHS]))
+    else:
+        tasks = derivative_tasks(deck, SPREADS, [spread_card_width(DEFAULT_FRONT_SIZE)])
+        tasks.append(("뒷면 썸네일", lambda: [get_back_thumb_bytes(w, deck.back_path) for w in BACK_THUMB_WIDTHS]))
+    tasks.append(("템플릿", lambda: warm_templates(deck, SPREADS)))
+    if DAILY_SPREAD in SPREADS:
+        tasks.append(("오늘의 카드", lambda: get_daily_table(deck.key, deck.locale, SPREADS[DAILY_SPREAD])))
+    return tasks
+
+def first_render_done() -> None:
+    """화면을 다 그린 뒤 호출. 프로세스의 첫 실행일 때만 시간 보고 + 워밍업 시작."""
+    warmup = get_warmup()
+    if warmup.mark_first_render():
+        warmup.start(warmup_tasks(), add_script_run_ctx)
 
 # ========================= 앱 본문 =========================
 st.set_page_config(page_title=APP_TITLE, page_icon="🔮", layout="wide")
 st.title(APP_TITLE)
 
-cards_master = load_cards()
-back_img = get_back_image()
+get_warmup().begin(_SCRIPT_T0, _IMPORT_MS)
+registry = get_registry()
+
+# 이번 rerun 동안 쓸 카탈로그 스냅샷(파일이 바뀌어도 rerun 도중에는 그대로)
+CATALOG = get_catalog_watcher().snapshot
+SPREADS = CATALOG.spreads
 
-with open("data/spreads.json", "r", encoding="utf-8") as f:
-    SPREADS = json.load(f)
+# 이미지 전송: 정적 서빙이 켜져 있으면 <picture>(WebP + 대체 이미지, 배율별), 아니면 st.image
+STATIC_IMAGES = bool(st.get_option("server.enableStaticServing"))
+CLIENT_HEADERS = getattr(getattr(st, "context", None), "headers", None) or {}
+
+LOCALE_LABELS = {"ko": "한국어", "en": "English", "ja": "日本語"}
 
 # ===== 사이드바 =====
 with st.sidebar:
     st.header("설정")
 
+    # 덱(아트)/언어 선택 — 등록된 것이 하나뿐이면 숨김
+    deck_keys = registry.deck_keys()
+    deck_key = registry.default_deck
+    if len(deck_keys) > 1:
+        deck_key = st.selectbox("🃏 덱", deck_keys, index=deck_keys.index(deck_key),
+                                format_func=registry.deck_name)
+    locales = registry.locales(deck_key)
+    locale = registry.default_locale if registry.default_locale in locales else locales[0]
+    if len(locales) > 1:
+        locale = st.selectbox("🌐 언어", locales, index=locales.index(locale),
+                              format_func=lambda k: LOCALE_LABELS.get(k, k))
+
     # 스프레드 선택 → 장수 자동 결정
     spread_key = st.selectbox(
         "🔮 스프레드 선택",
@@ -376,23 +452,106 @@ with st.sidebar:
     num_cards = len(current_spread["positions"])
     st.info(f"👉 이 스프레드는 **{num_cards}장**을 뽑습니다.")
 
+    # 1장 리딩 전용: 날짜·사용자별로 고정된 오늘의 카드
+    daily_mode = spread_key == DAILY_SPREAD and st.checkbox(
+        "🌞 오늘의 카드 모드", value=False, help="하루 동안 같은 카드가 나오며, 자정(KST)에 바뀝니다."
+    )
+
     # 역위 옵션
     allow_reversed = st.checkbox("역위치 포함", value=True)
     reversed_prob = st.slider("역위치 확률", 0.0, 1.0, DEFAULT_REVERSED_PROB, 0.05, disabled=not allow_reversed)
 
     # 앞면 전용 이미지 크기
-    front_img_size = st.slider("🖼️ 앞면 이미지 크기(px)", 100, 400, 200, 10)
+    front_img_size = st.slider("🖼️ 앞면 이미지 크기(px)", 100, 400, DEFAULT_FRONT_SIZE, 10)
+
+    # 느린 연결용: 1배율·낮은 품질 이미지(브라우저가 데이터 절약 모드면 기본으로 켬)
+    save_data = st.checkbox("📶 데이터 절약", value=wants_save_data(CLIENT_HEADERS),
+                            help="카드 이미지를 더 작고 가볍게 받습니다.")
+
+    # 공개된 카드를 스프레드 모양 이미지 1장으로(카드별 이미지 대신)
+    layout_view = st.checkbox("🗺️ 배치도로 보기", value=True)
+
+    # 고를 때마다 바로 공개(선택 순서 = 포지션 순서)
+    incremental = st.checkbox("카드별 즉시 공개", value=False,
+                              help="카드를 고르는 즉시 앞면과 포지션 해석을 보여줍니다.")
 
     # 종합 요약 포커스(연애/직업/금전/건강/조언)
-    focus = st.selectbox("요약 포커스", ["love", "career", "finance", "health", "advice"], index=0,
-                         format_func=lambda k: {"love":"연애","career":"직업","finance":"금전","health":"건강","advice":"조언"}[k])
-    back_thumb_width=st.slider("뒷면 썸네일 너비(px)", 120,220,160,10)
+    focus = st.selectbox("요약 포커스", FOCUS_KEYS, index=0, format_func=FOCUS_LABELS.get)
+    back_thumb_width=st.slider("뒷면 썸네일 너비(px)", min(BACK_THUMB_WIDTHS), max(BACK_THUMB_WIDTHS),
+                               DEFAULT_BACK_THUMB, BACK_THUMB_WIDTHS.step)
+
+    # 카드 의미 검색(이름/키워드/의미 문장)
+    search_query = st.text_input("🔎 카드 검색", placeholder="예: 새로운 시작, 재회, Queen")
 
     st.divider()
     if st.button("새로 섞기 / 초기화", use_container_width=True):
         st.session_state.clear()
+        st.query_params.pop("r", None)
         st.rerun()
 
+active_deck = get_deck(deck_key, locale)
+TIER = pick_tier(save_data)
+cards_master = active_deck.cards
+
+if search_query.strip():
+    with st.sidebar.expander("검색 결과", expanded=True):
+        hits = active_deck.search_index.search(search_query, limit=8)
+        if not hits:
+            st.caption("관련된 카드가 없습니다.")
+        for card_id, _score in hits:
+            c = active_deck.by_id[card_id]
+            st.markdown(f"- **{c.get('name_kr')}** ({c.get('name_en')})")
+
+# ===== 공유된 리딩(?r=토큰): 서버 저장 없이 토큰만으로 재구성 =====
+shared_token = st.query_params.get("r")
+if shared_token:
+    try:
+        snap = render_snapshot(shared_token, deck_key, locale, focus, CATALOG.version)
+    except ValueError:
+        st.error("공유 링크가 올바르지 않습니다.")
+        snap = None
+    if snap is not None:
+        st.subheader(f"🔗 공유된 리딩 — {SPREADS[snap['spread_key']]['name']}")
+        shared_spread = SPREADS[snap["spread_key"]]
+        render_spread_view(active_deck, snap["cards"], shared_spread, len(shared_spread["positions"]), front_img_size)
+        for i, c in enumerate(snap["cards"], start=1):
+            render_card_panel(active_deck, i, c, front_img_size, show_image=False)
+        render_reading(snap["story"], snap["fluent"], snap["summary"])
+        if st.button("새 리딩 시작"):
+            st.query_params.pop("r", None)
+            st.rerun()
+        first_render_done()
+        st.stop()
+
+# ===== 오늘의 카드(셔플/그리드 없이 미리 만든 결과만 표시) =====
+if daily_mode:
+    # 사용자 식별자는 URL(?u=)에 보관 → 새로고침해도 같은 카드
+    if "u" not in st.query_params:
+        st.query_params["u"] = uuid.uuid4().hex[:12]
+    day = today_str()
+    idx, rev = daily_assignment(st.query_params["u"], day, len(cards_master), allow_reversed)
+    entry = get_daily_table(deck_key, locale, current_spread)[(idx, rev)]
+
+    st.subheader("🌞 오늘의 카드")
+    st.caption(f"{day} · 자정(KST)이 지나면 새 카드가 배정됩니다.")
+    render_card_panel(active_deck, 1, entry["card"], front_img_size)
+    render_reading(entry["story"][focus], entry["fluent"][focus], entry["summary"])
+    log_reading(active_deck, spread_key, [entry["card"]], focus, DAILY_REVERSED_PROB if allow_reversed else 0.0,
+                f"daily:{day}:{reading_key(spread_key, [entry['card']])}")
+    first_render_done()
+    st.stop()
+
+# 오늘 많이 뽑힌 카드(analytics.py 롤업이 있을 때만)
+rollups = get_rollups()
+if rollups:
+    popular = top_cards(rollups, day=today_str(), limit=5)
+    if popular:
+        with st.sidebar.expander("📊 오늘 많이 뽑힌 카드"):
+            for row in popular:
+                c = active_deck.by_canonical.get(row["card_idx"])   # 기록은 표준 78장 번호
+                if c is not None:
+                    st.markdown(f"- **{c.get('name_kr')}** — {row['draws']}회 (역위 {row['reversed']})")
+
 # 스프레드 변경 시 선택 초기화
 if "last_spread" not in st.session_state:
     st.session_state.last_spread = spread_key
@@ -400,13 +559,26 @@ if st.session_state.last_spread != spread_key:
     st.session_state.selected_ids = []
     st.session_state.last_spread = spread_key
 
+# 덱/언어 변경·카탈로그 교체 시: 섞인 순서·정역위는 유지하고 카드 텍스트만 교체
+if st.session_state.get("deck_locale") != (deck_key, locale, CATALOG.version) and "deck" in st.session_state:
+    st.session_state.deck = [
+        {**active_deck.by_id[c["id"]], "is_reversed": c.get("is_reversed", False)}
+        for c in st.session_state.deck if c["id"] in active_deck.by_id
+    ]
+    st.session_state.pick_cache = {}
+st.session_state.deck_locale = (deck_key, locale, CATALOG.version)
+
 # 초기 덱/선택 상태
 if "deck" not in st.session_state:
-    deck = cards_master.copy()
+    # 레지스트리 카탈로그는 세션끼리 공유하므로 카드별 사본에 정/역위를 기록
+    deck = [dict(c) for c in cards_master]
     random.shuffle(deck)
     for c in deck:
         c["is_reversed"] = allow_reversed and (random.random() < reversed_prob)
     st.session_state.deck = deck
+    # 기록에는 섞을 때 실제로 쓴 확률을 남김(공개 시점의 슬라이더 값은 다를 수 있음)
+    st.session_state.deck_reversed_prob = reversed_prob if allow_reversed else 0.0
+    st.session_state.started_at = time.time()
 
 if "selected_ids" not in st.session_state:
     st.session_state.selected_ids = []
@@ -414,6 +586,7 @@ if "selected_ids" not in st.session_state:
 # ===== 78장 뒷면 그리드 =====
 st.subheader("카드를 선택하세요 (뒷면 클릭)")
 cols = st.columns(GRID_COLS)
+back = back_variants(back_thumb_width, active_deck.back_path, TIER) if STATIC_IMAGES else None
 
 for idx, card in enumerate(st.session_state.deck):
     col = cols[idx % GRID_COLS]
@@ -421,7 +594,10 @@ for idx, card in enumerate(st.session_state.deck):
         key = f"card_{card['id']}"
         selected = card["id"] in st.session_state.selected_ids
 
-        st.image(get_back_thumb_bytes(back_thumb_width), caption=f"{idx+1}")
+        if back is not None:
+            show_picture(back, back_thumb_width, alt="카드 뒷면", caption=f"{idx+1}")
+        else:
+            st.image(get_back_thumb_bytes(back_thumb_width, active_deck.back_path), caption=f"{idx+1}")
         if st.button("해제" if selected else "선택", key=key, use_container_width=True):
             if selected:
                 st.session_state.selected_ids.remove(card["id"])
@@ -433,88 +609,80 @@ for idx, card in enumerate(st.session_state.deck):
             st.rerun()
 
 st.caption(f"선택: {len(st.session_state.selected_ids)}/{num_cards}장")
-picked = [c for c in st.session_state.deck if c['id'] in st.session_state.selected_ids]
+# 포지션은 고른 순서대로(즉시 공개 모드와 같은 규칙: 모드를 바꿔도 같은 카드가 같은 자리)
+deck_by_id = {c["id"]: c for c in st.session_state.deck}
+picked = [deck_by_id[cid] for cid in st.session_state.selected_ids if cid in deck_by_id]
 st.info(f"선택: {len(picked)}/{num_cards}장")
 
+# 고른 카드의 앞면은 다음 카드를 고르는 동안 백그라운드에서 준비
+prefetch_fronts(active_deck, picked, front_img_size, layout_view)
+
+# ===== 공개 섹션(즉시 공개 모드) =====
+if incremental:
+    prune_pick_cache(st.session_state.selected_ids)
+    entries = [get_pick_entry(active_deck, c) for c in picked]
+    if entries:
+        st.divider()
+        st.subheader("🔓 공개된 카드")
+        pos_defs = normalize_positions(current_spread, num_cards)
+        if layout_view:
+            render_spread_view(active_deck, [e["card"] for e in entries], current_spread, num_cards, front_img_size)
+        for i, e in enumerate(entries, start=1):
+            render_card_panel(active_deck, i, e["card"], front_img_size, show_image=not layout_view)
+        story_md = "\n\n".join(position_line(e, i, pos_defs[i], focus) for i, e in enumerate(entries))
+        if len(entries) < num_cards:
+            st.divider()
+            st.subheader("📜 포지션별 스토리")
+            st.markdown(story_md)
+        else:
+            pieces = [e["piece"] for e in entries]
+            render_reading(story_md, compose_fluent_from_pieces(pieces, focus=focus, locale=locale),
+                           summarize_pieces(pieces, CATALOG.combo_matcher, locale))
+            render_share_link(spread_key, [e["card"] for e in entries])
+            log_reading(active_deck, spread_key, [e["card"] for e in entries], focus,
+                        st.session_state.get("deck_reversed_prob"),
+                        reading_key(spread_key, [e["card"] for e in entries]))
+
 # ===== 공개 섹션 =====
-if len(picked) == num_cards:
+elif len(picked) == num_cards:
     st.divider()
     st.subheader("🔓 공개된 카드")
 
+    if layout_view:
+        render_spread_view(active_deck, picked, current_spread, num_cards, front_img_size)
     for i, c in enumerate(picked, start=1):
-        img = get_front_image(c["id"])
-        if c.get("is_reversed"):
-            img = img.rotate(180)
-
-        with st.container(border=True):
-            name_kr = c.get("name_kr")
-            name_en = c.get("name_en") or c.get("name") or c.get("id")
-            display = f"{name_kr} ({name_en})" if (name_kr and name_en and name_en != name_kr) else (name_kr or name_en)
-
-            st.markdown(f"**{i}. {display}**  —  {'역위' if c.get('is_reversed') else '정위'}")
-            st.image(img, width=front_img_size)
-
-            # 개요 탭 제거 → 5탭만 유지
-            tabs = st.tabs(["연애", "직업", "금전", "건강", "조언"])
-            blk = c["reversed" if c.get("is_reversed") else "upright"]
-            with tabs[0]: st.write(blk.get("love", ""))
-            with tabs[1]: st.write(blk.get("career", ""))
-            with tabs[2]: st.write(blk.get("finance", ""))
-            with tabs[3]: st.write(blk.get("health", ""))
-            with tabs[4]: st.write(blk.get("advice", ""))
-
-    # ===== 포지션별 스토리 =====
-    st.divider()
-    st.subheader("📜 포지션별 스토리")
-    story_md = build_position_story(picked, current_spread, focus=focus)
-    st.markdown(story_md)
-
+        render_card_panel(active_deck, i, c, front_img_size, show_image=not layout_view)
 
-    # ===== 종합 해석 =====
-    st.divider()
-    st.subheader("🧩 종합 해석")
-
-    # 한두 줄 자연어 요약
-    st.markdown("**요약(한두 줄)**")
-    st.write(compose_fluent_summary(picked, focus=focus))
-
-    # 상세 요약(기존)
-    summary = summarize_drawn(picked)
-    with st.expander("요약 보기", expanded=True):
-        st.markdown(
-            f"""
-            **종합 개요**  
-            {summary.get('general','')}
-
-            **연애**: {summary.get('love','')}
-
-            **직업**: {summary.get('career','')}
-
-            **금전**: {summary.get('finance','')}
-
-            **건강**: {summary.get('health','')}
-
-            **조언**: {summary.get('advice','')}
-            """
-        )
+    render_reading(
+        build_position_story(picked, current_spread, focus=focus, locale=locale),
+        compose_fluent_summary(picked, focus=focus, locale=locale),
+        summarize_drawn(picked, CATALOG.combo_matcher, locale),
+    )
+    render_share_link(spread_key, picked)
+    log_reading(active_deck, spread_key, picked, focus, st.session_state.get("deck_reversed_prob"),
+                reading_key(spread_key, picked))
 
 # ========================= 푸터/도움말 =========================
     with st.expander("데이터/배포 가이드"):
         st.markdown(
         """
         **데이터 구조**
+        - `data/decks.json`: 덱(아트 폴더/뒷면)과 언어별 카드 데이터 등록
         - `data/cards.json`: 78장 메타/의미 (정위/역위, 카테고리별)
-        - `data/spreads.json`: 스프레드 정의(포지션 타이틀/역할)
+        - `data/cards.{lang}.json`: (선택) 언어 오버레이 — 바뀐 필드만 적으면 기본 언어 위에 덮어씀
+        - `data/spreads.json`: 스프레드 정의(포지션 타이틀/역할, 배치도 좌표 `layout`)
         - `data/combos.json`: 순서 의존 콤보 규칙(선택)
         - `cards/`: 각 카드 앞면 이미지(`{id}.jpg`)
         - `assets/card_back.png`: 공용 뒷면 이미지
 
         **배포 팁**
         - 이미지를 레포에 포함하면 Streamlit Community Cloud에서도 그대로 동작합니다.
-        - 또는 절대 URL로 호스팅하고 `get_front_image`를 URL 로더로 바꿔도 됩니다.
+        - 또는 절대 URL로 호스팅하고 `render_card_panel`·`render_spread_view`가 그 URL 을 쓰도록 바꿔도 됩니다.
 
         **저작권 주의**
         - 카드 일러스트 사용권 확인 필수. 의미 텍스트는 직접 작성/요약본 권장.
         - 모든 내용 작성 : 컴퓨터비전 B반 양혁준
         """
     )
+
+first_render_done()
@@ -0,0 +1,291 @@
+# card_lint.py — 카드 데이터(cards.json) 스키마 검사/린트
+# -------------------------------------------------
+# - 카드 1장 단위 검사: 필수 필드, (아르카나, 슈트, 랭크)가 78장 표준 구성에 있는지, id 와 일치하는지,
+#   upright/reversed 블록과 카테고리(general/love/...)의 유무·빈 문장
+# - 카탈로그 전체 검사: 중복/빠진 카드, combos.json 패턴 중 어떤 카드와도 맞지 않는 이름
+# - 카드별 내용 해시(정렬된 JSON의 sha256)와 카탈로그 해시를 기록
+#   · 카드 단위 검사 결과는 해시별로 기억 → 다음 실행에서는 바뀐 카드만 다시 검사
+#   · CLI 는 결과를 var/card_lint.json 에 남겨 배포 전 점검을 수 ms 안에 끝냄
+# - 수준: error = 앱이 깨지거나 규칙이 조용히 무시되는 문제, warning = 빈 문장 등 품질 문제
+#
+#   python card_lint.py                  # data/cards.json + data/combos.json
+#   python card_lint.py --strict         # warning 도 실패(종료 코드 1)로
+# -------------------------------------------------
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
+
+from reading import CATEGORY_KEYS, SUIT_KEYS, combo_name
+
+BASE = Path(__file__).parent
+DEFAULT_CARDS = BASE / "data" / "cards.json"
+DEFAULT_COMBOS = BASE / "data" / "combos.json"
+DEFAULT_CACHE = BASE / "var" / "card_lint.json"
+
+# 검사 규칙이 바뀌면 올림 → 기억해 둔 카드별 결과를 버리고 전부 다시 검사
+RULES_VERSION = 1
+
+MAJOR_RANKS = [f"{n:02d}" for n in range(22)]
+MINOR_RANKS = ["Ace"] + [f"{n:02d}" for n in range(2, 11)] + ["Page", "Knight", "Queen", "King"]
+ORIENTATIONS = ("upright", "reversed")
+_MAJOR_ID_RE = re.compile(r"MAJOR_(\d{2})_\w+")
+
+
+class Issue(NamedTuple):
+    level: str      # "error" | "warning"
+    code: str
+    card_id: str    # 카탈로그 전체 문제는 ""
+    detail: str
+
+
+class CatalogError(ValueError):
+    """error 수준 문제가 있는 카탈로그(핫 리로드/로딩 거부용)."""
+
+    def __init__(self, issues: List[Issue]) -> None:
+        self.issues = issues
+        head = "; ".join(f"{i.card_id or '-'} {i.code}: {i.detail}" for i in issues[:3])
+        more = f" 외 {len(issues) - 3}건" if len(issues) > 3 else ""
+        super().__init__(f"카드 데이터 오류 {len(issues)}건: {head}{more}")
+
+
+def expected_cards() -> List[Tuple[str, Optional[str], str]]:
+    """78장 표준 구성: (arcana, suit, rank)."""
+    majors = [("major", None, r) for r in MAJOR_RANKS]
+    minors = [("minor", s, r) for s in SUIT_KEYS for r in MINOR_RANKS]
+    return majors + minors
+
+
+EXPECTED = frozenset(expected_cards())
+# 파일 순서와 무관한 카드 번호(공유 토큰 등): 메이저 00~21, 이어서 슈트별 Ace~King
+_CANONICAL = {key: i for i, key in enumerate(expected_cards())}
+
+
+def canonical_index(card: Dict[str, Any]) -> Optional[int]:
+    """카드의 표준 78장 번호(0~77). 표준 구성에 없는 카드면 None."""
+    return _CANONICAL.get((card.get("arcana"), card.get("suit"), card.get("rank")))
+
+
+def record_hash(card: Any) -> str:
+    return hashlib.sha256(json.dumps(card, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def catalog_hash(record_hashes: List[str]) -> str:
+    return hashlib.sha256("\n".join(record_hashes).encode("ascii")).hexdigest()
+
+
+# ========================= 카드 1장 검사 =========================
+def check_card(card: Any) -> List[Issue]:
+    if not isinstance(card, dict):
+        return [Issue("error", "not-object", "", f"카드 항목이 객체가 아닙니다: {type(card).__name__}")]
+    card_id = card.get("id")
+    if not isinstance(card_id, str) or not card_id:
+        return [Issue("error", "missing-field", "", "id 가 없습니다")]
+    issues: List[Issue] = []
+
+    def add(level: str, code: str, detail: str) -> None:
+        issues.append(Issue(level, code, card_id, detail))
+
+    for field in ("name_kr", "name_en"):
+        if not card.get(field):
+            add("warning", "missing-field", f"{field} 가 비어 있습니다")
+
+    key = (card.get("arcana"), card.get("suit"), card.get("rank"))
+    if key not in EXPECTED:
+        add("error", "unknown-card", "(arcana, suit, rank) = ({}, {}, {}) 는 표준 78장에 없습니다".format(*key))
+    elif key[0] == "major":
+        m = _MAJOR_ID_RE.fullmatch(card_id)
+        if not m or m.group(1) != key[2]:
+            add("error", "id-mismatch", f"메이저 id 는 MAJOR_{key[2]}_이름 형식이어야 합니다")
+    elif card_id != f"{key[1].upper()}_{key[2]}":
+        add("error", "id-mismatch", f"마이너 id 는 {key[1].upper()}_{key[2]} 이어야 합니다")
+
+    keywords = card.get("keywords", [])
+    if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
+        add("error", "bad-type", "keywords 는 문자열 목록이어야 합니다")
+
+    for side in ORIENTATIONS:
+        blk = card.get(side)
+        if not isinstance(blk, dict):
+            add("error", "missing-orientation", f"{side} 블록이 없습니다")
+            continue
+        for cat in CATEGORY_KEYS:
+            text = blk.get(cat)
+            if cat not in blk:
+                add("warning", "missing-category", f"{side}.{cat}")
+            elif not isinstance(text, str):
+                add("error", "bad-type", f"{side}.{cat} 는 문자열이어야 합니다")
+            elif not text.strip():
+                add("warning", "empty-category", f"{side}.{cat}")
+        for extra in sorted(set(blk) - set(CATEGORY_KEYS)):
+            add("warning", "unknown-category", f"{side}.{extra}")
+    return issues
+
+
+# ========================= 카탈로그 검사 =========================
+def check_catalog(cards: List[Any]) -> List[Issue]:
+    issues: List[Issue] = []
+    ids = Counter(c.get("id") for c in cards if isinstance(c, dict))
+    for card_id, n in ids.items():
+        if card_id and n > 1:
+            issues.append(Issue("error", "duplicate-id", card_id, f"{n}번 나옵니다"))
+    present = {(c.get("arcana"), c.get("suit"), c.get("rank")) for c in cards if isinstance(c, dict)}
+    for arcana, suit, rank in expected_cards():
+        if (arcana, suit, rank) not in present:
+            label = f"메이저 {rank}" if arcana == "major" else f"{suit} {rank}"
+            issues.append(Issue("error", "missing-card", "", f"{label} 카드가 없습니다"))
+    return issues
+
+
+def check_combos(combos: List[Any], cards: List[Any]) -> List[Issue]:
+    """패턴의 이름이 카드의 콤보 이름(name_en → name_kr → id)과 하나도 맞지 않으면 그 규칙은 영영 안 걸림."""
+    names = {combo_name(c) for c in cards if isinstance(c, dict)}
+    issues: List[Issue] = []
+    for n, rule in enumerate(combos, 1):
+        pattern = rule.get("pattern") if isinstance(rule, dict) else None
+        if pattern and not isinstance(pattern, list):
+            # 문자열 pattern 은 글자 단위로 쪼개져 영영 안 걸림
+            issues.append(Issue("error", "combo-bad-pattern", "", f"콤보 #{n}: pattern 은 카드 이름 목록이어야 합니다"))
+            continue
+        if not pattern:
+            issues.append(Issue("warning", "combo-empty", "", f"콤보 #{n}: pattern 이 없습니다"))
+            continue
+        for token in pattern:
+            if not isinstance(token, str):
+                issues.append(Issue("error", "bad-type", "", f"콤보 #{n}: pattern 항목은 카드 이름 문자열이어야 합니다: {token!r}"))
+            elif token not in names:
+                issues.append(Issue("error", "combo-unresolved", "", f"콤보 #{n}: '{token}' 에 해당하는 카드가 없습니다"))
+        if not any(rule.get(k) for k in CATEGORY_KEYS):
+            issues.append(Issue("warning", "combo-no-message", "", f"콤보 #{n}: 카테고리 문구가 없습니다"))
+    return issues
+
+
+# ========================= 증분 린터 =========================
+class LintReport(NamedTuple):
+    catalog_hash: str
+    issues: List[Issue]
+    total: int          # 카드 수
+    rechecked: int      # 이번에 실제로 다시 검사한 카드 수
+
+    @property
+    def errors(self) -> List[Issue]:
+        return [i for i in self.issues if i.level == "error"]
+
+    @property
+    def warnings(self) -> List[Issue]:
+        return [i for i in self.issues if i.level == "warning"]
+
+
+class CardLinter:
+    """카드별 검사 결과를 내용 해시로 기억해, 바뀐 카드만 다시 검사."""
+
+    def __init__(self, state: Optional[Dict[str, Any]] = None) -> None:
+        self._records: Dict[str, List[Issue]] = {}
+        if state and state.get("rules") == RULES_VERSION:
+            for h, issues in state.get("records", {}).items():
+                self._records[h] = [Issue(*i) for i in issues]
+
+    def lint(self, cards: List[Any], combos: Optional[List[Any]] = None) -> LintReport:
+        hashes = [record_hash(c) for c in cards]
+        issues: List[Issue] = []
+        rechecked = 0
+        records: Dict[str, List[Issue]] = {}
+        for card, h in zip(cards, hashes):
+            found = self._records.get(h)
+            if found is None:
+                found = check_card(card)
+                rechecked += 1
+            records[h] = found
+            issues.extend(found)
+        # 지금 카탈로그에 없는 카드의 결과는 버림(파일이 끝없이 커지지 않게)
+        self._records = records
+        issues.extend(check_catalog(cards))
+        if combos is not None:
+            issues.extend(check_combos(combos, cards))
+        return LintReport(catalog_hash(hashes), issues, len(cards), rechecked)
+
+    def validate(self, cards: List[Any]) -> None:
+        """error 가 있으면 CatalogError(DeckRegistry 의 validate 훅)."""
+        errors = self.lint(cards).errors
+        if errors:
+            raise CatalogError(errors)
+
+    def validate_combos(self, combos: List[Any], cards: List[Any]) -> None:
+        """콤보 규칙에 error 가 있으면 CatalogError(CatalogWatcher 의 validate_combos 훅)."""
+        errors = [i for i in check_combos(combos, cards) if i.level == "error"]
+        if errors:
+            raise CatalogError(errors)
+
+    def state(self) -> Dict[str, Any]:
+        return {"rules": RULES_VERSION,
+                "records": {h: [list(i) for i in issues] for h, issues in self._records.items()}}
+
+
+def load_state(path: Path = DEFAULT_CACHE) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def save_state(state: Dict[str, Any], path: Path = DEFAULT_CACHE) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def format_issues(issues: List[Issue], fold: int = 3) -> List[str]:
+    """같은 (수준, 코드, 내용)이 여러 카드에서 나오면 한 줄로 접음."""
+    groups: Dict[Tuple[str, str, str], List[str]] = defaultdict(list)
+    for i in issues:
+        groups[(i.level, i.code, i.detail)].append(i.card_id)
+    lines = []
+    for (level, code, detail), ids in groups.items():
+        if len(ids) > fold:
+            where = f"{len(ids)}장 ({', '.join(ids[:fold])} 외 {len(ids) - fold}장)"
+        else:
+            where = ", ".join(x for x in ids if x) or "-"
+        lines.append(f"{level.upper():7s} {code:20s} {detail}  ← {where}")
+    return lines
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="카드 데이터 스키마 검사")
+    ap.add_argument("--cards", default=str(DEFAULT_CARDS))
+    ap.add_argument("--combos", default=str(DEFAULT_COMBOS))
+    ap.add_argument("--cache", default=str(DEFAULT_CACHE), help="카드별 검사 결과 기억 파일")
+    ap.add_argument("--no-cache", action="store_true", help="기억한 결과 없이 전부 다시 검사")
+    ap.add_argument("--strict", action="store_true", help="warning 도 실패로")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    with open(args.cards, "r", encoding="utf-8") as f:
+        cards = json.load(f)
+    combos = None
+    if Path(args.combos).exists():
+        with open(args.combos, "r", encoding="utf-8") as f:
+            combos = json.load(f)
+    linter = CardLinter(None if args.no_cache else load_state(Path(args.cache)))
+    report = linter.lint(cards, combos)
+    save_state(linter.state(), Path(args.cache))
+
+    for line in format_issues(report.issues):
+        print(line)
+    print(f"카드 {report.total}장 (다시 검사 {report.rechecked}장), error {len(report.errors)} / "
+          f"warning {len(report.warnings)} — {report.catalog_hash[:12]} ({(time.perf_counter() - t0) * 1000:.1f}ms)")
+    if report.errors or (args.strict and report.warnings):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
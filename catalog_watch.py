@@ -0,0 +1,199 @@
+# catalog_watch.py — 카탈로그 파일 변경 감시 + 핫 리로드
+# -------------------------------------------------
+# - 감시 대상: 덱 구성(decks.json)과 언어별 카드 파일, spreads.json, combos.json, templates.json
+# - 백그라운드 스레드가 주기적으로 stat(mtime, 크기)만 확인
+#   · 달라 보일 때만 내용 해시(sha256)를 비교 → 내용이 같은 저장(touch 등)은 무시
+# - 바뀐 파일에 해당하는 부분만 백그라운드에서 새로 만든 뒤 교체
+#   · 카드 파일: 해당 덱의 카탈로그 + 검색 색인(DeckRegistry.reload)
+#   · combos.json: 콤보 규칙 컴파일(ComboMatcher) + validate_combos 훅(기본 덱 카드 이름과 대조), spreads.json: 스프레드 정의
+#   · templates.json: 언어별 템플릿 엔진
+# - 스프레드/콤보는 불변 스냅샷(Catalog) 하나로 묶어 참조만 바꿔치기 → 읽는 쪽은 잠금 없이 항상 완전한 한 벌
+# - 파일 묶음(덱 카드 파일 / spreads / combos / templates)마다 따로 검사·반영
+#   · 쓰다 만 파일(JSON 오류 등)이면 그 묶음만 기존 것을 유지하고, 다음 변경 때 다시 시도
+#   → 고장 난 cards.json 이 있어도 다른 파일의 정상적인 수정은 바로 반영
+#
+#   watcher = CatalogWatcher(registry); watcher.start()
+#   catalog = watcher.snapshot        # 요청(rerun)마다 한 번 잡아서 끝까지 사용
+# -------------------------------------------------
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable, Set
+
+from deck_registry import DeckRegistry
+from reading import ComboMatcher, load_json_list, load_spreads
+from text_templates import TEMPLATES_JSON, compile_engines, set_engines
+
+log = logging.getLogger(__name__)
+
+BASE = Path(__file__).parent
+DATA_DIR = BASE / "data"
+POLL_INTERVAL = float(os.environ.get("TAROT_CATALOG_POLL", "2"))  # 초, 0 이면 감시 안 함
+
+Stat = Optional[Tuple[int, int]]
+RELOAD_ERRORS = (OSError, ValueError, KeyError, TypeError)
+
+
+class Catalog:
+    """한 시점의 스프레드/콤보 규칙 묶음(불변). version 은 무엇이든 교체될 때마다 1씩 증가."""
+
+    __slots__ = ("version", "spreads", "combos", "combo_matcher")
+
+    def __init__(self, version: int, spreads: Dict[str, Any], combos: List[Dict[str, Any]]) -> None:
+        self.version = version
+        self.spreads = spreads
+        self.combos = combos
+        self.combo_matcher = ComboMatcher(combos)
+
+
+def _stat(path: Path) -> Stat:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _digest(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class CatalogWatcher:
+    """카탈로그 파일을 감시하다가 바뀌면 새로 만들어 교체."""
+
+    def __init__(self, registry: DeckRegistry, data_dir: Path = DATA_DIR,
+                 interval: float = POLL_INTERVAL, templates_path: Path = TEMPLATES_JSON,
+                 validate_combos: Optional[Callable[[List[Any], List[Any]], None]] = None) -> None:
+        self.registry = registry
+        self.validate_combos = validate_combos
+        self.interval = interval
+        self.spreads_path = Path(data_dir) / "spreads.json"
+        self.combos_path = Path(data_dir) / "combos.json"
+        self.templates_path = Path(templates_path)
+        self._stats: Dict[Path, Stat] = {}
+        self._hashes: Dict[Path, Optional[str]] = {}
+        self._pending: Dict[Path, Optional[str]] = {}   # 반영에 실패한 변경
+        self._listeners: List[Callable[[Catalog], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        for path in self._watched():
+            self._stats[path] = _stat(path)
+            self._hashes[path] = _digest(path)
+        combos = load_json_list(self.combos_path)
+        if self.validate_combos is not None:
+            try:
+                self.validate_combos(combos, self.registry.get().cards)
+            except RELOAD_ERRORS as e:   # 시작할 때는 알리기만(기존 동작 유지)
+                log.warning("combos.json 검사 실패: %s", e)
+        self.snapshot = Catalog(0, load_spreads(self.spreads_path), combos)
+
+    def _watched(self) -> List[Path]:
+        return [*self.registry.source_files(), self.spreads_path, self.combos_path, self.templates_path]
+
+    def add_listener(self, fn: Callable[[Catalog], None]) -> None:
+        """교체가 끝난 뒤 새 스냅샷으로 호출(응답 캐시 비우기 등). 감시 스레드에서 불림."""
+        self._listeners.append(fn)
+
+    # ---- 변경 확인 ----
+    def _changed(self) -> Dict[Path, Optional[str]]:
+        changed: Dict[Path, Optional[str]] = {}
+        for path in self._watched():
+            stat = _stat(path)
+            if path in self._stats and stat == self._stats[path]:
+                continue
+            self._stats[path] = stat
+            digest = _digest(path)
+            if path not in self._hashes or digest != self._hashes[path]:
+                changed[path] = digest
+            else:
+                self._pending.pop(path, None)   # 반영된 내용으로 되돌려짐 → 더 기다릴 것 없음
+        return changed
+
+    def check_now(self) -> bool:
+        """한 번 확인하고, 바뀐 것이 있으면 묶음별로 다시 만들어 교체. 하나라도 교체했으면 True."""
+        with self._lock:
+            fresh = self._changed()
+            if not fresh:
+                return False
+            changed = {**self._pending, **fresh}
+            applied = self._rebuild(set(changed))
+            # 실패한 묶음만 보류했다가 다음 변경 때 다시 시도(쓰는 중이던 파일일 수 있음)
+            self._pending = {p: d for p, d in changed.items() if p not in applied}
+            self._hashes.update({p: changed[p] for p in applied})
+            if not applied:
+                return False
+            snapshot = self.snapshot
+        log.info("카탈로그 교체 v%d: %s", snapshot.version, ", ".join(p.name for p in sorted(applied)))
+        for fn in self._listeners:
+            fn(snapshot)
+        return True
+
+    def _rebuild(self, changed: Set[Path]) -> Set[Path]:
+        """묶음마다 새로 만들어 교체하고, 반영된 파일을 돌려줌. 실패한 묶음은 기존 것 유지."""
+        old = self.snapshot
+        spreads, combos = old.spreads, old.combos
+        applied: Set[Path] = set()
+
+        def attempt(files: Set[Path], build: Callable[[], Any]) -> Any:
+            try:
+                result = build()
+            except RELOAD_ERRORS as e:
+                log.warning("카탈로그 다시 읽기 실패(기존 것 유지): %s: %s",
+                            ", ".join(p.name for p in sorted(files)), e)
+                return None
+            applied.update(files)
+            return result
+
+        # 덱은 레지스트리가 직접 새로 만들어 교체
+        deck_files = changed.intersection(self.registry.source_files())
+        if deck_files:
+            attempt(deck_files, lambda: self.registry.reload(deck_files))
+        if self.templates_path in changed:
+            engines = attempt({self.templates_path}, lambda: compile_engines(self.templates_path))
+            if engines is not None:
+                set_engines(engines)
+        if self.spreads_path in changed:
+            new_spreads = attempt({self.spreads_path}, lambda: load_spreads(self.spreads_path))
+            spreads = old.spreads if new_spreads is None else new_spreads
+        if self.combos_path in changed:
+            new_combos = attempt({self.combos_path}, lambda: self._load_combos())
+            combos = old.combos if new_combos is None else new_combos
+        # 스프레드/콤보는 스냅샷 하나로 묶어 참조만 바꿔치기(덱만 바뀌어도 버전은 올림)
+        if applied:
+            self.snapshot = Catalog(old.version + 1, spreads, combos)
+        return applied
+
+    def _load_combos(self) -> List[Dict[str, Any]]:
+        combos = load_json_list(self.combos_path)
+        ComboMatcher(combos)   # 규칙 형식 확인
+        if self.validate_combos is not None:
+            # 이름이 틀린 카드("Ace of Cupz")나 문자열 pattern 은 영영 안 걸리므로 반영하지 않음
+            self.validate_combos(combos, self.registry.get().cards)
+        return combos
+
+    # ---- 감시 스레드 ----
+    def start(self) -> None:
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="catalog-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check_now()
+            except Exception:
+                log.exception("카탈로그 감시 오류")
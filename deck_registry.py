@@ -0,0 +1,336 @@
+# deck_registry.py — 멀티 덱 / 멀티 언어 카드 카탈로그 레지스트리
+# -------------------------------------------------
+# - data/decks.json 에 덱(카드 아트)과 언어(ko/en/ja)별 카드 데이터 파일을 등록
+# - 덱은 처음 사용할 때만 카탈로그/이미지 경로 인덱스를 로딩(lazy)하고 캐시
+# - 언어 파일은 기본 언어 위에 덮어쓰는 오버레이(바뀐 필드만 적으면 됨)
+# - 덱/언어 사이에 바뀌지 않은 텍스트는 같은 문자열 객체를 공유
+#   · 공유 풀은 로딩된 카탈로그의 문자열만 붙잡음(덱 해제·다시 읽기 때 남은 카탈로그로 다시 만듦)
+# - 메모리 예산(카탈로그 + 검색 색인 추정치)을 넘으면 가장 오래 안 쓴 덱부터 해제(LRU)
+#   · 이미지는 경로만 보관. 디코드한 축소본은 spread_layout 의 캐시가 크기 상한을 두고 관리
+# - reload(): 바뀐 파일을 쓰는 덱만 새로 만들어 교체(핫 리로드, catalog_watch.py)
+# -------------------------------------------------
+
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable
+
+from card_lint import canonical_index
+from search_index import CardSearchIndex
+
+BASE = Path(__file__).parent
+DECKS_JSON = BASE / "data" / "decks.json"
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp")
+
+DEFAULT_MEMORY_BUDGET = int(os.environ.get("TAROT_DECK_MEMORY_MB", "256")) * 1024 * 1024
+
+# 레지스트리 파일이 없을 때 쓰는 기본 구성(기존 단일 경로와 동일)
+_FALLBACK_CONFIG = {
+    "default_deck": "rws",
+    "default_locale": "ko",
+    "decks": {
+        "rws": {
+            "name": "라이더-웨이트",
+            "cards_dir": "cards",
+            "back": "assets/card_back.png",
+            "locales": {"ko": "data/cards.json"},
+        }
+    },
+}
+
+
+class TextPool:
+    """동일한 문자열을 하나의 객체로 모아 덱/언어 간에 공유."""
+
+    def __init__(self) -> None:
+        self._pool: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, value: Any) -> Any:
+        if isinstance(value, str):
+            with self._lock:
+                return self._pool.setdefault(value, value)
+        if isinstance(value, dict):
+            return {self.intern(k): self.intern(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.intern(v) for v in value]
+        return value
+
+    def retain(self, values: Iterable[Any]) -> None:
+        """values(남아 있는 카탈로그)에서 닿는 문자열만 남기고 나머지는 놓음."""
+        pool: Dict[str, str] = {}
+
+        def walk(value: Any) -> None:
+            if isinstance(value, str):
+                pool.setdefault(value, value)
+            elif isinstance(value, dict):
+                for k, v in value.items():
+                    walk(k)
+                    walk(v)
+            elif isinstance(value, list):
+                for v in value:
+                    walk(v)
+
+        for value in values:
+            walk(value)
+        with self._lock:
+            self._pool = pool
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+
+def _overlay(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """카드 1장에 언어 오버레이 적용. upright/reversed 는 카테고리 단위로 병합."""
+    out = dict(base)
+    for k, v in patch.items():
+        if k == "id":
+            continue
+        if isinstance(v, dict) and isinstance(out.get(k), dict):
+            merged = dict(out[k])
+            merged.update({ck: cv for ck, cv in v.items() if cv})
+            out[k] = merged
+        elif v not in (None, "", []):
+            out[k] = v
+    return out
+
+
+def _estimate_size(obj: Any, seen: Optional[set] = None) -> int:
+    """컨테이너/문자열 기준 대략적인 메모리 사용량(공유 객체는 한 번만 계산)."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_estimate_size(k, seen) + _estimate_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_estimate_size(v, seen) for v in obj)
+    return size
+
+
+class Deck:
+    """덱 하나의 카탈로그(카드 메타/의미), 검색 색인, 이미지 경로 인덱스."""
+
+    def __init__(self, key: str, locale: str, name: str, cards: List[Dict[str, Any]],
+                 image_index: Dict[str, Path], back_path: Path) -> None:
+        self.key = key
+        self.locale = locale
+        self.name = name
+        self.cards = cards
+        self.image_index = image_index
+        self.back_path = back_path
+        self.by_id: Dict[str, Dict[str, Any]] = {c["id"]: c for c in cards}
+        self.index_of: Dict[str, int] = {c["id"]: i for i, c in enumerate(cards)}
+        # 표준 78장 번호 → 카드(공유 토큰 풀이용, 파일 순서와 무관)
+        self.by_canonical: Dict[int, Dict[str, Any]] = {}
+        for c in cards:
+            n = canonical_index(c)
+            if n is not None:
+                self.by_canonical.setdefault(n, c)
+        # 검색 색인은 덱(언어)별로 로딩 시점에 한 번만 생성
+        self.search_index = CardSearchIndex(cards)
+        self.catalog_bytes = _estimate_size(cards) + _estimate_size(self.search_index.postings)
+
+    @property
+    def nbytes(self) -> int:
+        return self.catalog_bytes
+
+    def image_path(self, card_id: str) -> Path:
+        path = self.image_index.get(card_id)
+        if path is None:
+            raise KeyError(f"덱 '{self.key}'에 카드 이미지가 없습니다: {card_id}")
+        return path
+
+
+class DeckRegistry:
+    """덱 구성 파일을 읽고, 요청된 (덱, 언어)를 필요할 때만 로딩/캐시."""
+
+    def __init__(self, config_path: Path = DECKS_JSON, memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 validate: Optional[Callable[[List[Dict[str, Any]]], None]] = None) -> None:
+        self.config_path = Path(config_path)
+        self.base_dir = self.config_path.parent.parent if self.config_path.exists() else BASE
+        self.config = self._read_config()
+        self.memory_budget = memory_budget
+        # 언어 오버레이까지 합친 카탈로그 검사(예: card_lint.CardLinter.validate). 문제가 있으면 예외
+        self.validate = validate
+        self.text_pool = TextPool()
+        self._decks: "OrderedDict[Tuple[str, str], Deck]" = OrderedDict()
+        # 같은 언어 파일 조합은 덱이 달라도 파싱 결과를 공유
+        self._catalogs: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+
+    def _read_config(self) -> Dict[str, Any]:
+        if not self.config_path.exists():
+            return _FALLBACK_CONFIG
+        with open(self.config_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    # ---- 구성 조회 ----
+    @property
+    def default_deck(self) -> str:
+        return self.config.get("default_deck") or next(iter(self.config["decks"]))
+
+    @property
+    def default_locale(self) -> str:
+        return self.config.get("default_locale", "ko")
+
+    def deck_keys(self) -> List[str]:
+        return list(self.config["decks"].keys())
+
+    def deck_name(self, deck_key: str) -> str:
+        return self.config["decks"][deck_key].get("name", deck_key)
+
+    def _locale_files(self, deck_key: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """덱의 언어 파일 목록. 'text_from' 으로 다른 덱의 텍스트를 그대로 쓸 수 있음.
+        config 를 주면 그 구성 기준(reload 가 교체 전에 새 구성으로 계산할 때)."""
+        config = config or self.config
+        spec = config["decks"][deck_key]
+        if "locales" in spec:
+            return spec["locales"]
+        src = spec.get("text_from") or config.get("default_deck") or next(iter(config["decks"]))
+        return self._locale_files(src, config) if src != deck_key else {}
+
+    def locales(self, deck_key: str, config: Optional[Dict[str, Any]] = None) -> List[str]:
+        return list(self._locale_files(deck_key, config).keys())
+
+    # ---- 로딩 ----
+    def _source_paths(self, deck_key: str, locale: str, config: Optional[Dict[str, Any]] = None) -> Tuple[str, ...]:
+        config = config or self.config
+        default_locale = config.get("default_locale", "ko")
+        files = self._locale_files(deck_key, config)
+        base = files.get(default_locale) or next(iter(files.values()))
+        chain = [base]
+        if locale != default_locale and locale in files:
+            chain.append(files[locale])
+        return tuple(str(self.base_dir / p) for p in chain)
+
+    def source_files(self) -> List[Path]:
+        """구성 파일 + 등록된 모든 언어 파일(변경 감시 대상)."""
+        files = {self.config_path}
+        for deck_key in self.deck_keys():
+            files.update(self.base_dir / p for p in self._locale_files(deck_key).values())
+        return sorted(files)
+
+    def _load_catalog(self, paths: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        cached = self._catalogs.get(paths)
+        if cached is None:
+            cached = self._catalogs[paths] = self._parse_catalog(paths)
+        return cached
+
+    def _parse_catalog(self, paths: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        with open(paths[0], "r", encoding="utf-8") as f:
+            cards = json.load(f)
+        for p in paths[1:]:
+            with open(p, "r", encoding="utf-8") as f:
+                patches = {c["id"]: c for c in json.load(f)}
+            cards = [_overlay(c, patches[c["id"]]) if c["id"] in patches else c for c in cards]
+        if self.validate is not None:
+            self.validate(cards)
+        return self.text_pool.intern(cards)
+
+    def _scan_images(self, cards_dir: Path) -> Dict[str, Path]:
+        index: Dict[str, Path] = {}
+        if cards_dir.is_dir():
+            for p in cards_dir.iterdir():
+                if p.suffix.lower() in IMAGE_EXTS:
+                    index[p.stem] = p
+        return index
+
+    def get(self, deck_key: Optional[str] = None, locale: Optional[str] = None) -> Deck:
+        with self._lock:
+            config = self.config   # reload 가 구성과 덱을 함께 바꾸므로 한 벌만 보고 만듦
+            deck_key = deck_key or self.default_deck
+            if locale not in self.locales(deck_key, config):
+                locale = self.default_locale
+            key = (deck_key, locale)
+            deck = self._decks.get(key)
+            if deck is not None:
+                self._decks.move_to_end(key)
+                return deck
+            paths = self._source_paths(deck_key, locale, config)
+            deck = self._build_deck(deck_key, locale, self._load_catalog(paths), config)
+            self._decks[key] = deck
+            self._evict(keep=key)
+            return deck
+
+    def _build_deck(self, deck_key: str, locale: str, cards: List[Dict[str, Any]],
+                    config: Optional[Dict[str, Any]] = None) -> Deck:
+        spec = (config or self.config)["decks"][deck_key]
+        return Deck(
+            key=deck_key,
+            locale=locale,
+            name=spec.get("name", deck_key),
+            cards=cards,
+            image_index=self._scan_images(self.base_dir / spec.get("cards_dir", "cards")),
+            back_path=self.base_dir / spec.get("back", "assets/card_back.png"),
+        )
+
+    # ---- 다시 읽기 ----
+    def reload(self, changed: Iterable[Path]) -> List[Tuple[str, str]]:
+        """바뀐 파일을 쓰는 덱만 새로 만들어(카탈로그·검색 색인) 한꺼번에 교체.
+        구성 파일이 바뀌면 로딩된 덱 전부가 대상. 새 덱은 잠금 밖에서 새 구성 기준으로 만들고,
+        구성과 덱은 잠금 안에서 함께 교체. 파일 오류(JSON/키)가 나면 아무것도 바꾸지 않고 예외를 그대로 올림.
+        교체 전에 기존 Deck 을 받아 간 쪽은 그 덱을 끝까지 그대로 씀. 반환: 교체된 (덱, 언어)."""
+        changed = {str(p) for p in changed}
+        config_changed = str(self.config_path) in changed
+        with self._lock:
+            loaded = list(self._decks)
+            old_config = self.config
+        config = self._read_config() if config_changed else old_config
+
+        # 새 구성 기준으로 경로 계산(덱이 빠졌으면 해제만). self.config 는 교체 때까지 그대로
+        fresh: Dict[Tuple[str, str], Deck] = {}
+        catalogs: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for key in loaded:
+            if key[0] not in config["decks"] or key[1] not in self.locales(key[0], config):
+                continue
+            paths = self._source_paths(*key, config)
+            if not config_changed and not changed.intersection(paths):
+                continue
+            if paths not in catalogs:
+                catalogs[paths] = self._parse_catalog(paths)
+            fresh[key] = self._build_deck(key[0], key[1], catalogs[paths], config)
+
+        with self._lock:
+            self.config = config
+            if config_changed:
+                self._catalogs.clear()
+            else:
+                for paths in [p for p in self._catalogs if changed.intersection(p)]:
+                    del self._catalogs[paths]
+            self._catalogs.update(catalogs)
+            for key in list(self._decks):
+                if key in fresh:
+                    self._decks[key] = fresh[key]
+                elif config_changed or key not in loaded and changed.intersection(self._source_paths(*key)):
+                    # 구성에서 빠졌거나, 다시 만드는 사이에 옛 카탈로그로 로딩된 덱 → 다음 get() 때 새로
+                    del self._decks[key]
+            self.text_pool.retain(self._catalogs.values())
+        return list(fresh)
+
+    # ---- 메모리 관리 ----
+    def memory_usage(self) -> int:
+        with self._lock:
+            return sum(d.nbytes for d in self._decks.values())
+
+    def _evict(self, keep: Tuple[str, str]) -> None:
+        """예산을 넘으면 오래 안 쓴 덱부터 해제. 방금 요청된 덱은 남김.
+        그 덱 하나만으로 예산을 넘으면 더 줄이지 않음(카탈로그·색인은 덱을 쓰는 동안 나눌 수 없음)."""
+        evicted = False
+        while self.memory_usage() > self.memory_budget and len(self._decks) > 1:
+            key = next(iter(self._decks))
+            if key == keep:
+                self._decks.move_to_end(key)
+                continue
+            del self._decks[key]
+            evicted = True
+            paths = self._source_paths(*key)
+            if not any(self._source_paths(*k) == paths for k in self._decks):
+                self._catalogs.pop(paths, None)
+        if evicted:
+            self.text_pool.retain(self._catalogs.values())
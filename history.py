@@ -0,0 +1,234 @@
+# history.py — 완료된 리딩 기록(append-only) + 집계 조회
+# -------------------------------------------------
+# - SQLite(WAL) 한 파일: 리딩 1건 = readings 1행 + reading_cards N행
+# - 앱은 record() 로 큐에 넣기만 하고 바로 돌아감(렌더링 지연 없음)
+#   · 백그라운드 쓰기 스레드가 묶음(batch) 단위로 한 트랜잭션에 기록
+#   · 큐가 가득 차면 기다리지 않고 버림(dropped 카운트)
+#   · 묶음 쓰기가 실패하면 롤백 후 한 건씩 다시 쓰고, 그래도 안 되는 건만 버림(failed 카운트, 로그)
+# - card_idx 는 카드의 표준 78장 번호(card_lint.canonical_index) — cards.json 의 순서와 무관
+# - 카드별/스프레드별 집계는 같은 트랜잭션에서 일 단위 롤업 테이블에 누적
+#   → 원본이 수천만 행이어도 집계 조회는 롤업(일수 × 78행)만 읽음
+# -------------------------------------------------
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DB = Path(os.environ.get("TAROT_HISTORY_DB", Path(__file__).parent / "var" / "history.sqlite3"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    id            INTEGER PRIMARY KEY,
+    started_at    REAL,
+    completed_at  REAL NOT NULL,
+    day           TEXT NOT NULL,
+    spread        TEXT NOT NULL,
+    focus         TEXT,
+    deck          TEXT,
+    locale        TEXT,
+    reversed_prob REAL,
+    token         TEXT
+);
+CREATE TABLE IF NOT EXISTS reading_cards (
+    reading_id INTEGER NOT NULL,
+    pos        INTEGER NOT NULL,
+    card_idx   INTEGER NOT NULL,
+    reversed   INTEGER NOT NULL,
+    PRIMARY KEY (reading_id, pos)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS card_daily (
+    day      TEXT NOT NULL,
+    card_idx INTEGER NOT NULL,
+    draws    INTEGER NOT NULL,
+    reversed INTEGER NOT NULL,
+    PRIMARY KEY (day, card_idx)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS spread_daily (
+    day      TEXT NOT NULL,
+    spread   TEXT NOT NULL,
+    focus    TEXT NOT NULL,
+    readings INTEGER NOT NULL,
+    PRIMARY KEY (day, spread, focus)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_readings_day ON readings(day);
+"""
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _day_range(since: Optional[str], until: Optional[str]) -> Tuple[str, List[str]]:
+    clauses, args = [], []
+    if since:
+        clauses.append("day >= ?")
+        args.append(since)
+    if until:
+        clauses.append("day <= ?")
+        args.append(until)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+
+class HistoryStore:
+    """리딩 기록 저장소. 쓰기는 백그라운드 스레드 한 개가 전담."""
+
+    def __init__(self, path: Path = DEFAULT_DB, batch_size: int = 256,
+                 flush_interval: float = 1.0, max_queue: int = 10000) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.failed = 0
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self._local = threading.local()
+        with _connect(self.path) as conn:
+            conn.executescript(SCHEMA)
+        self._writer = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._writer.start()
+
+    # ---- 쓰기 ----
+    def record(self, event: Dict[str, Any]) -> bool:
+        """리딩 1건을 큐에 넣음. 막히지 않으며, 큐가 가득 차면 False."""
+        event.setdefault("completed_at", time.time())
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def flush(self) -> None:
+        """지금까지 넣은 기록이 모두 커밋될 때까지 대기(테스트/종료용)."""
+        self._queue.join()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 기록을 쓰고 쓰기 스레드를 끝냄. 큐가 막혀 있어도 timeout 이상 기다리지 않음(종료 훅용)."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            log.warning("기록 큐가 가득 차 종료를 기다리지 않음(남은 %d건)", self._queue.qsize())
+            return
+        self._writer.join(timeout)
+
+    def _run(self) -> None:
+        conn = _connect(self.path)
+        stop = False
+        while not stop:
+            batch: List[Dict[str, Any]] = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            try:
+                if batch:
+                    self._write_safely(conn, batch)
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+        conn.close()
+
+    def _write_safely(self, conn: sqlite3.Connection, batch: List[Dict[str, Any]]) -> None:
+        """묶음 실패(잘못된 기록, DB 잠김 등)에도 쓰기 스레드는 계속 돎. 실패한 묶음은 한 건씩 다시 씀."""
+        try:
+            self._write_batch(conn, batch)
+            return
+        except Exception:
+            if len(batch) == 1:
+                self.failed += 1
+                log.exception("리딩 기록 쓰기 실패(1건 버림)")
+                return
+        for ev in batch:
+            self._write_safely(conn, [ev])
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Dict[str, Any]]) -> None:
+        card_rows: List[Tuple[int, int, int, int]] = []
+        card_roll: Dict[Tuple[str, int], List[int]] = defaultdict(lambda: [0, 0])
+        spread_roll: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        with conn:
+            for ev in batch:
+                day = ev.get("day") or datetime.fromtimestamp(ev["completed_at"]).date().isoformat()
+                cur = conn.execute(
+                    "INSERT INTO readings (started_at, completed_at, day, spread, focus, deck, locale, reversed_prob, token)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (ev.get("started_at"), ev["completed_at"], day, ev["spread"], ev.get("focus"),
+                     ev.get("deck"), ev.get("locale"), ev.get("reversed_prob"), ev.get("token")),
+                )
+                rid = cur.lastrowid
+                for pos, (card_idx, rev) in enumerate(ev["cards"]):
+                    card_rows.append((rid, pos, int(card_idx), 1 if rev else 0))
+                    roll = card_roll[(day, int(card_idx))]
+                    roll[0] += 1
+                    roll[1] += 1 if rev else 0
+                spread_roll[(day, ev["spread"], ev.get("focus") or "")] += 1
+            conn.executemany("INSERT INTO reading_cards VALUES (?, ?, ?, ?)", card_rows)
+            conn.executemany(
+                "INSERT INTO card_daily VALUES (?, ?, ?, ?) ON CONFLICT(day, card_idx)"
+                " DO UPDATE SET draws = draws + excluded.draws, reversed = reversed + excluded.reversed",
+                [(d, c, v[0], v[1]) for (d, c), v in card_roll.items()],
+            )
+            conn.executemany(
+                "INSERT INTO spread_daily VALUES (?, ?, ?, ?) ON CONFLICT(day, spread, focus)"
+                " DO UPDATE SET readings = readings + excluded.readings",
+                [(d, s, f, n) for (d, s, f), n in spread_roll.items()],
+            )
+
+    # ---- 조회 ----
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.path)
+        return conn
+
+    def count(self) -> int:
+        return self._reader().execute("SELECT COUNT(*) FROM readings").fetchone()[0]
+
+    def card_stats(self, since: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """카드별 뽑힌 횟수/역위 횟수/역위 비율(많이 뽑힌 순). 날짜는 'YYYY-MM-DD'."""
+        where, args = _day_range(since, until)
+        rows = self._reader().execute(
+            f"SELECT card_idx, SUM(draws), SUM(reversed) FROM card_daily{where}"
+            " GROUP BY card_idx ORDER BY SUM(draws) DESC, card_idx", args,
+        ).fetchall()
+        return [{"card_idx": c, "draws": d, "reversed": r, "reversed_ratio": r / d if d else 0.0}
+                for c, d, r in rows]
+
+    def spread_stats(self, since: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """스프레드별 리딩 수(많은 순)."""
+        where, args = _day_range(since, until)
+        rows = self._reader().execute(
+            f"SELECT spread, SUM(readings) FROM spread_daily{where} GROUP BY spread ORDER BY 2 DESC", args,
+        ).fetchall()
+        return [{"spread": s, "readings": n} for s, n in rows]
+
+    def focus_stats(self, since: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """요약 포커스별 리딩 수(많은 순)."""
+        where, args = _day_range(since, until)
+        rows = self._reader().execute(
+            f"SELECT focus, SUM(readings) FROM spread_daily{where} GROUP BY focus ORDER BY 2 DESC", args,
+        ).fetchall()
+        return [{"focus": f, "readings": n} for f, n in rows]
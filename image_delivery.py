@@ -0,0 +1,192 @@
+# image_delivery.py — 카드 이미지 전송(형식·품질·해상도 선택)
+# -------------------------------------------------
+# - st.image 는 JPEG/PNG 로만 다시 인코딩하고, 표시 너비보다 큰 이미지는 rerun 마다 서버에서 줄여 다시 인코딩
+#   → 완성된 파일을 정적 폴더(./static/img, server.enableStaticServing)에 한 번만 써 두고 <picture> 로 표시
+# - 형식: <source type="image/webp"> — WebP 를 아는 브라우저만 받아 감(모르면 JPEG/PNG 대체 이미지)
+#   · AVIF 는 Pillow 기본 빌드에 인코더가 없고 Streamlit 정적 서빙이 image/avif 로 내보내지 않아 제외
+# - 해상도: srcset 1x/2x 중 브라우저가 화면 DPR 에 맞는 것 하나만 받음
+# - 품질 단계: 기본 / 데이터 절약(사이드바 설정, Save-Data 헤더) — 절약은 1x + 낮은 품질
+#   · DPR/ECT 클라이언트 힌트는 쓰지 않음: 브라우저는 서버가 Accept-CH 를 보내야만 보내는데
+#     Streamlit 은 응답 헤더를 정할 수 없음(Save-Data 는 힌트 요청 없이도 옴)
+# - 파일 이름은 내용 해시 + ?v= → 브라우저가 오래 캐시, 같은 이미지는 세션이 달라도 파일 하나
+# - 폴더 전체 크기 상한(TAROT_IMAGE_CACHE_MB): 넘으면 가장 오래 안 쓰인 파일부터 지움
+#   · 최근 MIN_FILE_AGE 초 안에 쓰인 파일은 열려 있는 화면이 아직 받을 수 있어 남겨 둠
+#   · 지운 파일은 다음에 필요할 때 다시 인코딩(시작할 때 이전 실행이 남긴 파일도 같은 기준으로 정리)
+# - 만들 이미지는 (키, 배율) → PIL 이미지 함수로 받음: 기존 축소본 캐시(spread_layout) 위에서 인코딩만 추가
+#
+#   store = ImageStore()
+#   variants = store.variants(("back", path, 160), lambda d: thumb(160 * d), tier)
+#   st.markdown(picture_html(variants, 160, alt="카드 뒷면"), unsafe_allow_html=True)
+# -------------------------------------------------
+
+import hashlib
+import html
+import os
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Callable, Mapping, NamedTuple
+
+from PIL import Image
+
+BASE = Path(__file__).parent
+IMG_DIR = BASE / "static" / "img"
+URL_PREFIX = "app/static/img"          # Streamlit 정적 서빙 경로(상대 URL)
+MAX_URLS = 8192                        # 기억할 (키, 형식, 품질, 배율) → URL 수
+MAX_BYTES = int(float(os.environ.get("TAROT_IMAGE_CACHE_MB", "64")) * 1024 * 1024)
+MIN_FILE_AGE = 600.0                   # 초
+
+
+class Tier(NamedTuple):
+    """품질 단계. fallback 은 WebP 를 모르는 브라우저용 JPEG(투명 이미지는 PNG)."""
+    name: str
+    webp_quality: int
+    fallback_quality: int
+    densities: Tuple[int, ...]
+
+
+TIERS: Dict[str, Tier] = {
+    "standard": Tier("standard", 80, 85, (1, 2)),
+    "saver": Tier("saver", 60, 65, (1,)),
+}
+
+
+class Variants(NamedTuple):
+    """한 이미지의 전송용 파일들: WebP srcset, 대체 이미지 URL."""
+    webp_srcset: str
+    fallback: str
+
+
+# ========================= 데이터 절약 =========================
+def wants_save_data(headers: Mapping[str, str]) -> bool:
+    """브라우저의 데이터 절약 모드(Save-Data: on)."""
+    return (headers.get("Save-Data") or "").strip().lower() == "on"
+
+
+def pick_tier(save_data: bool) -> Tier:
+    """데이터 절약이면 1x + 낮은 품질, 아니면 기본(1x/2x)."""
+    return TIERS["saver" if save_data else "standard"]
+
+
+# ========================= 인코딩/저장 =========================
+def encode(img: Image.Image, fmt: str, quality: int) -> Tuple[bytes, str]:
+    """PIL 이미지 → (바이트, 확장자). fmt: "webp" 또는 "fallback"(JPEG, 투명하면 PNG)."""
+    buf = BytesIO()
+    if "A" in img.getbands() and img.getchannel("A").getextrema()[0] == 255:
+        img = img.convert("RGB")   # 알파가 전부 불투명(카드 뒷면 PNG 등)이면 JPEG 로
+    if fmt == "webp":
+        img.save(buf, format="WEBP", quality=quality, method=4)
+        return buf.getvalue(), "webp"
+    if img.mode in ("RGBA", "LA", "P"):
+        img.save(buf, format="PNG", optimize=True)
+        return buf.getvalue(), "png"
+    img.convert("RGB").save(buf, format="JPEG", quality=quality, optimize=True, progressive=True)
+    return buf.getvalue(), "jpg"
+
+
+class ImageStore:
+    """인코딩한 이미지를 내용 해시 이름으로 정적 폴더에 한 번만 쓰고 URL 을 기억(폴더 크기 상한, LRU)."""
+
+    def __init__(self, root: Path = IMG_DIR, url_prefix: str = URL_PREFIX, max_urls: int = MAX_URLS,
+                 max_bytes: int = MAX_BYTES, min_age: float = MIN_FILE_AGE) -> None:
+        self.root = Path(root)
+        self.url_prefix = url_prefix
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.min_age = min_age
+        self._urls: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()      # 키 → 파일 이름
+        self._files: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()   # 파일 이름 → (크기, 마지막 사용), 오래된 순
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._scan()
+
+    def _scan(self) -> None:
+        """이전 실행이 남긴 파일을 마지막 수정 시각 순으로 등록하고 상한에 맞춰 정리."""
+        if not self.root.is_dir():
+            return
+        found = []
+        for path in self.root.iterdir():
+            if path.name.startswith("."):
+                path.unlink(missing_ok=True)    # 쓰다 만 임시 파일
+                continue
+            st = path.stat()
+            found.append((st.st_mtime, path.name, st.st_size))
+        with self._lock:
+            for mtime, name, size in sorted(found):
+                self._files[name] = (size, mtime)
+                self._bytes += size
+            self._prune()
+
+    def _touch(self, name: str) -> bool:
+        entry = self._files.get(name)
+        if entry is None:
+            return False
+        self._files[name] = (entry[0], time.time())
+        self._files.move_to_end(name)
+        return True
+
+    def _prune(self) -> None:
+        """상한을 넘으면 오래 안 쓰인 파일부터 삭제(최근에 쓰인 파일은 남김). 잠금 안에서 호출."""
+        cutoff = time.time() - self.min_age
+        while self._bytes > self.max_bytes and self._files:
+            name, (size, used) = next(iter(self._files.items()))
+            if used > cutoff:
+                break
+            del self._files[name]
+            self._bytes -= size
+            (self.root / name).unlink(missing_ok=True)
+
+    def url(self, key: Tuple[Any, ...], make: Callable[[], Tuple[bytes, str]]) -> str:
+        """key 로 처음 요청될 때(또는 파일이 정리된 뒤)만 make() 로 인코딩해 파일로 씀. 이후에는 URL 만 돌려줌."""
+        with self._lock:
+            name = self._urls.get(key)
+            if name is not None and self._touch(name):
+                self._urls.move_to_end(key)
+                return self._url_for(name)
+        data, ext = make()
+        digest = hashlib.sha1(data).hexdigest()[:16]
+        name = f"{digest}.{ext}"
+        with self._lock:
+            if not self._touch(name):
+                # 임시 파일에 쓰고 교체 → 반쯤 쓴 파일이 서빙되는 일이 없음
+                self.root.mkdir(parents=True, exist_ok=True)
+                path = self.root / name
+                tmp = path.with_name(f".{name}.{threading.get_ident()}.tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+                self._files[name] = (len(data), time.time())
+                self._bytes += len(data)
+                self._prune()
+            self._urls[key] = name
+            self._urls.move_to_end(key)
+            while len(self._urls) > self.max_urls:
+                self._urls.popitem(last=False)
+        return self._url_for(name)
+
+    def _url_for(self, name: str) -> str:
+        return f"{self.url_prefix}/{name}?v={name.split('.')[0]}"
+
+    def variants(self, key: Tuple[Any, ...], render: Callable[[int], Image.Image], tier: Tier) -> Variants:
+        """render(배율) 로 만든 이미지를 단계별 WebP(배율마다) + 대체 이미지(가장 낮은 배율) 파일로."""
+        srcset = []
+        for d in tier.densities:
+            url = self.url((*key, "webp", tier.webp_quality, d),
+                           lambda d=d: encode(render(d), "webp", tier.webp_quality))
+            srcset.append(f"{url} {d}x")
+        low = min(tier.densities)
+        fallback = self.url((*key, "fallback", tier.fallback_quality, low),
+                            lambda: encode(render(low), "fallback", tier.fallback_quality))
+        return Variants(", ".join(srcset), fallback)
+
+
+def picture_html(variants: Variants, width: int, alt: str = "", caption: Optional[str] = None) -> str:
+    """<picture> 마크업(표시 너비 width, 좁은 칸에서는 칸 너비에 맞춰 줄어듦)."""
+    img = (f'<picture><source type="image/webp" srcset="{variants.webp_srcset}">'
+           f'<img src="{variants.fallback}" alt="{html.escape(alt)}" width="{width}" '
+           f'style="max-width:100%;height:auto" loading="lazy" decoding="async"></picture>')
+    if caption is not None:
+        img += (f'<div style="text-align:center;font-size:0.875rem;opacity:0.6">'
+                f'{html.escape(caption)}</div>')
+    return f'<div style="margin-bottom:0.5rem">{img}</div>'
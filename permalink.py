@@ -0,0 +1,93 @@
+# permalink.py — 리딩 공유용 짧은 토큰(base62)
+# -------------------------------------------------
+# - 리딩 = (스프레드 코드, 카드 번호들(순서 유지), 역위 비트들) → 정수 하나로 혼합 기수 인코딩
+#   · 카드 번호는 표준 78장 순서(card_lint.canonical_index), 스프레드는 spreads.json 의 "code"
+#     → 파일의 카드/스프레드 순서를 바꾸거나 스프레드를 추가해도 예전 링크가 같은 리딩으로 풀림
+#   · 켈틱 크로스 10장도 15자 안팎
+# - 서버에 아무것도 저장하지 않음: URL ?r=<토큰> 만으로 공개 화면을 다시 만든다
+# -------------------------------------------------
+
+from typing import List, Tuple
+
+ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_INDEX = {ch: i for i, ch in enumerate(ALPHABET)}
+
+VERSION = 2
+VERSION_RADIX = 4
+SPREAD_RADIX = 4096          # 스프레드 코드 0~4095
+CARD_RADIX = 78
+MAX_TOKEN_LEN = 32
+
+
+def _to_base62(n: int) -> str:
+    if n == 0:
+        return ALPHABET[0]
+    out = []
+    while n:
+        n, r = divmod(n, 62)
+        out.append(ALPHABET[r])
+    return "".join(reversed(out))
+
+
+def _from_base62(token: str) -> int:
+    n = 0
+    for ch in token:
+        if ch not in _INDEX:
+            raise ValueError(f"잘못된 토큰 문자: {ch!r}")
+        n = n * 62 + _INDEX[ch]
+    return n
+
+
+def encode_reading(spread_code: int, card_idxs: List[int], reversed_flags: List[bool]) -> str:
+    """리딩 → base62 토큰(항상 현재 버전). 카드 장수는 스프레드가 정하므로 따로 기록하지 않음."""
+    if not 0 <= spread_code < SPREAD_RADIX:
+        raise ValueError(f"스프레드 코드 범위 초과(0~{SPREAD_RADIX - 1}): {spread_code}")
+    if len(card_idxs) != len(reversed_flags):
+        raise ValueError("카드 수와 정/역위 수가 다릅니다")
+    digits: List[Tuple[int, int]] = [(VERSION, VERSION_RADIX), (spread_code, SPREAD_RADIX)]
+    for idx, rev in zip(card_idxs, reversed_flags):
+        if not 0 <= idx < CARD_RADIX:
+            raise ValueError(f"카드 번호 범위 초과: {idx}")
+        digits.append((idx, CARD_RADIX))
+        digits.append((1 if rev else 0, 2))
+    acc = 0
+    for value, radix in reversed(digits):
+        acc = acc * radix + value
+    return _to_base62(acc)
+
+
+def _split_header(token: str) -> Tuple[int, int]:
+    """토큰 → (스프레드 코드, 나머지 정수)."""
+    acc = _checked_int(token)
+    version, acc = acc % VERSION_RADIX, acc // VERSION_RADIX
+    if version != VERSION:
+        raise ValueError(f"지원하지 않는 토큰 버전: {version}")
+    return acc % SPREAD_RADIX, acc // SPREAD_RADIX
+
+
+def decode_spread(token: str) -> int:
+    """토큰에서 스프레드 코드만 먼저 꺼냄(장수를 알아야 나머지를 풀 수 있음)."""
+    return _split_header(token)[0]
+
+
+def decode_reading(token: str, n_cards: int) -> Tuple[int, List[int], List[bool]]:
+    """토큰 → (스프레드 코드, 카드 번호들, 역위 여부들). 형식이 틀리면 ValueError."""
+    spread_idx, acc = _split_header(token)
+    idxs: List[int] = []
+    revs: List[bool] = []
+    for _ in range(n_cards):
+        idx, acc = acc % CARD_RADIX, acc // CARD_RADIX
+        rev, acc = acc % 2, acc // 2
+        idxs.append(idx)
+        revs.append(bool(rev))
+    if acc:
+        raise ValueError("토큰 길이가 스프레드와 맞지 않습니다")
+    if len(set(idxs)) != len(idxs):
+        raise ValueError("같은 카드가 두 번 들어 있습니다")
+    return spread_idx, idxs, revs
+
+
+def _checked_int(token: str) -> int:
+    if not token or len(token) > MAX_TOKEN_LEN:
+        raise ValueError("토큰 길이가 올바르지 않습니다")
+    return _from_base62(token)
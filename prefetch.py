@@ -0,0 +1,47 @@
+# prefetch.py — 카드를 고르는 동안 앞면 이미지를 미리 만들어 두는 스레드 풀
+# -------------------------------------------------
+# - 고른 카드의 앞면 축소본/전송 파일(현재 크기·정/역위·품질 단계)을 백그라운드에서 디코드·인코드
+#   → 사용자가 나머지 카드를 고르는 동안 끝나 있고, 공개할 때는 캐시에서 바로 읽음
+#   → 마지막 카드를 고르는 순간 한꺼번에 공개돼도 카드 여러 장이 병렬로 처리됨
+# - 작업 함수는 결과가 캐시되는 것(예: spread_layout.fitted_front, ImageStore 를 거치는 앞면)만 넘김
+#   · 끝난 작업은 그 캐시에서, 진행 중인 작업은 같은 Future 를 기다려 한 번만 계산
+# -------------------------------------------------
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+DEFAULT_WORKERS = 4
+
+Job = Tuple[Callable[..., Any], Tuple[Any, ...]]
+
+
+class Prefetcher:
+    """(캐시되는 함수, 인자) 단위 미리 계산. 같은 작업은 동시에 하나만."""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._inflight: Dict[Job, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        job = (fn, args)
+        with self._lock:
+            if job in self._inflight:
+                return
+            fut = self._pool.submit(fn, *args)
+            self._inflight[job] = fut
+        fut.add_done_callback(lambda _f: self._forget(job))
+
+    def _forget(self, job: Job) -> None:
+        with self._lock:
+            self._inflight.pop(job, None)
+
+    def get(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """진행 중이면 그 결과를 기다리고, 아니면 fn 을 바로 호출(이미 끝났다면 캐시 적중)."""
+        with self._lock:
+            fut = self._inflight.get((fn, args))
+        return fut.result() if fut is not None else fn(*args)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
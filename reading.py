@@ -0,0 +1,252 @@
+# reading.py — 리딩 텍스트 생성 로직(Streamlit 비의존)
+# -------------------------------------------------
+# - 포지션별 스토리 / 한두 줄 자연어 요약 / 규칙형 종합 요약
+# - 문장 틀은 text_templates.py(data/templates.json)가 담당
+# - Streamlit 앱(app.py)과 HTTP API(api_server.py)가 함께 사용
+# -------------------------------------------------
+
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Iterable, Union
+
+from text_templates import DEFAULT_LOCALE, get_engine
+
+FOCUS_KEYS = ["love", "career", "finance", "health", "advice"]
+FOCUS_LABELS = {"love": "연애", "career": "직업", "finance": "금전", "health": "건강", "advice": "조언"}
+
+
+def load_json_list(path: Path) -> List[Dict[str, Any]]:
+    """선택 데이터 파일(combos.json 등): 없으면 빈 리스트."""
+    path = Path(path)
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return []
+
+
+def load_spreads(path: Path) -> Dict[str, Dict[str, Any]]:
+    """spreads.json 읽기. "code"(공유 토큰용 고정 번호)가 겹치면 ValueError."""
+    with open(path, "r", encoding="utf-8") as f:
+        spreads = json.load(f)
+    seen: Dict[Any, str] = {}
+    for key, sp in spreads.items():
+        code = sp.get("code")
+        if code is None:
+            continue
+        if code in seen:
+            raise ValueError(f"스프레드 code {code} 가 '{seen[code]}', '{key}' 에 겹칩니다")
+        seen[code] = key
+    return spreads
+
+
+def display_name(card: Dict[str, Any]) -> str:
+    """'한글명 (영문명)' 표기. 둘 중 하나만 있으면 그것만."""
+    name_kr = card.get("name_kr")
+    name_en = card.get("name_en") or card.get("name") or card.get("id")
+    return f"{name_kr} ({name_en})" if (name_kr and name_en and name_en != name_kr) else (name_kr or name_en)
+
+
+# ========================= 카드 조각(piece) =========================
+CATEGORY_KEYS = ["general", "love", "career", "finance", "health", "advice"]
+SUIT_KEYS = ["wands", "cups", "swords", "pentacles"]
+
+def combo_name(card: Dict[str, Any]) -> str:
+    """콤보 패턴 매칭용 이름: name_en → 없으면 name_kr → 없으면 id."""
+    return card.get("name_en") or card.get("name_kr") or card.get("id")
+
+
+def card_piece(card: Dict[str, Any]) -> Dict[str, Any]:
+    """요약에 필요한 값만 카드 1장에서 미리 뽑아 둔 조각.
+    카드를 고를 때 한 번 만들어 두면, 스토리/요약은 조각만 이어 붙여 갱신된다."""
+    rev = bool(card.get("is_reversed"))
+    return {
+        "id": card.get("id"),
+        "display": display_name(card),
+        "reversed": rev,
+        "major": card.get("arcana") == "major",
+        "suit": card.get("suit"),
+        "combo_name": combo_name(card),
+        "texts": card["reversed" if rev else "upright"],
+    }
+
+
+def _counts(pieces: List[Dict[str, Any]]) -> Tuple[int, int, Dict[str, int]]:
+    majors = sum(1 for p in pieces if p["major"])
+    reversed_cnt = sum(1 for p in pieces if p["reversed"])
+    suits = {k: 0 for k in SUIT_KEYS}
+    for p in pieces:
+        if p["suit"] in suits:
+            suits[p["suit"]] += 1
+    return majors, reversed_cnt, suits
+
+
+# ========================= 콤보 규칙 =========================
+class ComboMatcher:
+    """combos.json 규칙을 한 번 컴파일한 것.
+    패턴의 첫 카드 이름으로 규칙을 묶어 두고, 뽑힌 카드와 관련 있는 규칙만 순서대로 검사."""
+
+    def __init__(self, combos: List[Dict[str, Any]]) -> None:
+        self.rules: List[Tuple[Tuple[str, ...], Dict[str, str]]] = []
+        self.by_first: Dict[str, List[int]] = {}
+        for rule in combos:
+            pattern = rule.get("pattern") or []
+            if not isinstance(pattern, list) or not all(isinstance(t, str) for t in pattern):
+                continue   # 문자열 pattern(글자 단위로 쪼개짐)·이름이 아닌 항목은 건너뜀(린터가 error 로 잡음)
+            pattern = tuple(pattern)
+            if not pattern:
+                continue
+            msgs = {cat: rule.get(cat) or rule.get("general") for cat in CATEGORY_KEYS}
+            self.by_first.setdefault(pattern[0], []).append(len(self.rules))
+            self.rules.append((pattern, {k: v for k, v in msgs.items() if v}))
+
+    def match(self, names_in_order: List[str]) -> List[Dict[str, str]]:
+        """순서대로(사이에 다른 카드가 있어도) 패턴이 모두 나타나는 규칙의 카테고리별 문구."""
+        candidates = sorted({i for n in set(names_in_order) for i in self.by_first.get(n, ())})
+        out = []
+        for i in candidates:
+            pattern, msgs = self.rules[i]
+            it = iter(names_in_order)
+            if all(token in it for token in pattern):
+                out.append(msgs)
+        return out
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+# ========================= 종합 해석 로직 =========================
+def summarize_pieces(pieces: List[Dict[str, Any]], combos: Union[ComboMatcher, List[Dict[str, Any]], None] = None,
+                     locale: str = DEFAULT_LOCALE) -> Dict[str, str]:
+    """간단 규칙 기반 요약 + (있다면) 콤보 룰 적용"""
+    if not pieces:
+        return {k: "" for k in CATEGORY_KEYS}
+
+    majors, reversed_cnt, suits = _counts(pieces)
+
+    def cat_text(cat: str) -> str:
+        lines = []
+        for p in pieces:
+            txt = p["texts"].get(cat, "")
+            if txt:
+                lines.append(txt)
+        return " / ".join(lines[:3])
+
+    matcher = combos if isinstance(combos, ComboMatcher) else ComboMatcher(combos or [])
+    combo_msgs = {k: [] for k in CATEGORY_KEYS}
+    for msgs in matcher.match([p["combo_name"] for p in pieces]):
+        for cat, msg in msgs.items():
+            combo_msgs[cat].append(msg)
+
+    header = get_engine(locale).summary_header(len(pieces), majors, reversed_cnt, suits)
+
+    summary = {k: cat_text(k) for k in CATEGORY_KEYS}
+    for k in CATEGORY_KEYS:
+        if combo_msgs[k]:
+            summary[k] = (summary[k] + " | " if summary[k] else "") + " | ".join(combo_msgs[k][:2])
+    summary["general"] = header + ("\n" + summary["general"] if summary["general"] else "")
+    return summary
+
+
+def summarize_drawn(cards: List[Dict[str, Any]], combos: Union[ComboMatcher, List[Dict[str, Any]], None] = None,
+                    locale: str = DEFAULT_LOCALE) -> Dict[str, str]:
+    return summarize_pieces([card_piece(c) for c in cards], combos, locale)
+
+
+# 포커스별 문장 선택 우선순위(포커스 → 조언 → 개요 → 나머지)
+FOCUS_ORDER = {
+    "love":   ["love", "advice", "general", "career", "finance", "health"],
+    "career": ["career", "advice", "general", "finance", "love", "health"],
+    "finance":["finance","advice","general","career","love","health"],
+    "health": ["health","advice","general","career","finance","love"],
+    "advice": ["advice","general","career","finance","health","love"],
+}
+DEFAULT_ORDER = ["advice","general","career","finance","health","love"]
+
+
+def _pick_text(blk: Dict[str, Any], focus: str) -> str:
+    """포커스(연애/직업/금전/건강/조언) 우선으로 카드 한 장에서 한 줄 선택"""
+    for k in FOCUS_ORDER.get(focus, DEFAULT_ORDER):
+        t = (blk.get(k) or "").strip()
+        if t:
+            return t
+    return ""
+
+
+def _pick_text_from_card(card: Dict[str, Any], focus: str) -> str:
+    return _pick_text(card["reversed" if card.get("is_reversed") else "upright"], focus)
+
+
+def normalize_positions(current_spread: Dict[str, Any], n_cards: int) -> List[Dict[str, Any]]:
+    """
+    positions 항목이
+      - ["과거","현재","미래"] 같은 '문자열 리스트' 이거나
+      - [{"title":"과거","role":"past"}, ...] 같은 '딕셔너리 리스트'
+    둘 다 동작하도록 방어적으로 처리.
+    """
+    raw_positions = (current_spread or {}).get("positions", []) or []
+    pos_defs: List[Dict[str, Any]] = []
+    for p in raw_positions:
+        if isinstance(p, dict):
+            pos_defs.append(p)
+        elif isinstance(p, str):
+            pos_defs.append({"title": p})
+        else:
+            pos_defs.append({})
+
+    # 만약 포지션 개수가 카드보다 적으면 빈 정의로 채워줌(제목은 템플릿의 position_title)
+    if len(pos_defs) < n_cards:
+        for i in range(len(pos_defs), n_cards):
+            pos_defs.append({})
+    return pos_defs
+
+
+def build_position_line(i: int, piece: Dict[str, Any], pos: Dict[str, Any], focus: str,
+                        locale: str = DEFAULT_LOCALE) -> str:
+    """포지션 한 칸(0부터 i번째)의 스토리 한 단락."""
+    out: List[str] = []
+    get_engine(locale).emit_position_line(out, i, piece, pos, _pick_text(piece["texts"], focus))
+    return "".join(out)
+
+
+def _story_items(picked: List[Dict[str, Any]], current_spread: Dict[str, Any], focus: str):
+    pos_defs = normalize_positions(current_spread, len(picked))
+    for i, card in enumerate(picked):
+        piece = card_piece(card)
+        yield piece, pos_defs[i], _pick_text(piece["texts"], focus)
+
+
+def build_position_story(picked: List[Dict[str, Any]], current_spread: Dict[str, Any], focus: str,
+                         locale: str = DEFAULT_LOCALE) -> str:
+    return get_engine(locale).render_many([_story_items(picked, current_spread, focus)])[0]
+
+
+def build_position_stories(readings: Iterable[Tuple[List[Dict[str, Any]], Dict[str, Any], str]],
+                           locale: str = DEFAULT_LOCALE) -> List[str]:
+    """(카드들, 스프레드, 포커스) 여러 건의 포지션별 스토리를 한 번에 생성."""
+    return get_engine(locale).render_many(_story_items(*r) for r in readings)
+
+
+def compose_fluent_from_pieces(pieces: List[Dict[str, Any]], focus: str = "love",
+                               locale: str = DEFAULT_LOCALE) -> str:
+    """정/역위·슈트·메이저 비율 기반으로 1~2문장 자연어 요약."""
+    engine = get_engine(locale)
+    majors, reversed_cnt, suits = _counts(pieces)
+    mood_txt = engine.mood_text(len(pieces), majors, reversed_cnt, suits)
+
+    # 포커스 카테고리에서 상위 1~2개 문장만 뽑아 연결
+    lines = []
+    for p in pieces:
+        t = (p["texts"].get(focus) or "").strip()
+        if t:
+            lines.append(t)
+            if len(lines) == 2:
+                break
+
+    out: List[str] = []
+    engine.emit_fluent(out, mood_txt, lines)
+    return "".join(out).strip()
+
+
+def compose_fluent_summary(cards: List[Dict[str, Any]], focus: str = "love",
+                           locale: str = DEFAULT_LOCALE) -> str:
+    return compose_fluent_from_pieces([card_piece(c) for c in cards], focus, locale)
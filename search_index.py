@@ -0,0 +1,153 @@
+# search_index.py — 카드 이름/키워드/의미 문장 전문 검색 인덱스
+# -------------------------------------------------
+# - 한국어는 띄어쓰기/조사 변형이 많아 단어 대신 글자 n-gram(2-gram)으로 색인
+#   · 한 글자 질의(돈, 꿈, 빛 …)도 긴 단어 안에서 찾도록 한글/한자 글자 하나씩도 함께 색인
+#     (영문 글자는 제외, 문서 길이 정규화는 2-gram 개수 기준이라 두 글자 이상 질의 점수는 그대로)
+# - 필드별 가중치(이름 > 키워드 > 의미 문장) + BM25 점수를 색인 시점에 미리 계산
+# - 질의는 토큰별 포스팅 리스트 합산만 하므로 1ms 이내
+# - 앱(사이드바 검색)과 일괄 처리/에디터(CLI) 양쪽에서 그대로 사용
+#
+#   python search_index.py "새로운 시작"
+# -------------------------------------------------
+
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from typing import List, Dict, Any, Tuple, Iterable
+
+NGRAM = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 필드 가중치: 이름이 맞으면 의미 문장보다 훨씬 위로
+FIELD_WEIGHTS = {
+    "name_kr": 3.0,
+    "name_en": 3.0,
+    "keywords": 2.0,
+    "text": 1.0,
+}
+TEXT_CATEGORIES = ["general", "love", "career", "finance", "health", "advice"]
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """NFKC 정규화 + 소문자화 후 단어별 글자 2-gram. 한 글자 단어는 그대로."""
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKC", text).lower()
+    tokens: List[str] = []
+    for word in _WORD_RE.findall(text):
+        if len(word) <= NGRAM:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + NGRAM] for i in range(len(word) - NGRAM + 1))
+    return tokens
+
+
+def unigrams(text: str) -> List[str]:
+    """두 글자 이상 단어 속의 비ASCII 글자 하나씩(한 글자 질의용 색인 토큰)."""
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKC", text).lower()
+    return [ch for word in _WORD_RE.findall(text) if len(word) > 1 for ch in word if not ch.isascii()]
+
+
+def _card_fields(card: Dict[str, Any]) -> Dict[str, str]:
+    texts: List[str] = []
+    for side in ("upright", "reversed"):
+        blk = card.get(side) or {}
+        texts.extend(blk.get(k) or "" for k in TEXT_CATEGORIES)
+    return {
+        "name_kr": card.get("name_kr") or "",
+        "name_en": card.get("name_en") or "",
+        "keywords": " ".join(card.get("keywords") or []),
+        "text": " ".join(t for t in texts if t),
+    }
+
+
+class CardSearchIndex:
+    """카드 목록 위에 만든 역색인. 점수는 색인 시점에 미리 계산해 둠."""
+
+    def __init__(self, cards: Iterable[Dict[str, Any]]) -> None:
+        self.ids: List[str] = []
+        # 토큰 → [(카드 번호, 가중 BM25 점수)]
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self._build(cards)
+
+    def _build(self, cards: Iterable[Dict[str, Any]]) -> None:
+        field_tf: List[Dict[str, Dict[str, int]]] = []
+        field_len: List[Dict[str, int]] = []
+        field_len_sum: Dict[str, int] = defaultdict(int)
+        for card in cards:
+            self.ids.append(card["id"])
+            per_field: Dict[str, Dict[str, int]] = {}
+            lengths: Dict[str, int] = {}
+            for field, text in _card_fields(card).items():
+                tf: Dict[str, int] = defaultdict(int)
+                tokens = tokenize(text)
+                for tok in tokens + unigrams(text):
+                    tf[tok] += 1
+                per_field[field] = tf
+                lengths[field] = len(tokens)
+                field_len_sum[field] += len(tokens)
+            field_tf.append(per_field)
+            field_len.append(lengths)
+
+        n_docs = len(self.ids)
+        if not n_docs:
+            return
+        avg_len = {f: (field_len_sum[f] / n_docs) or 1.0 for f in FIELD_WEIGHTS}
+
+        df: Dict[str, int] = defaultdict(int)
+        for per_field in field_tf:
+            for tok in set().union(*(tf.keys() for tf in per_field.values())):
+                df[tok] += 1
+
+        scores: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        for doc, per_field in enumerate(field_tf):
+            for field, tf in per_field.items():
+                length = field_len[doc][field]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_len[field])
+                for tok, freq in tf.items():
+                    idf = math.log(1 + (n_docs - df[tok] + 0.5) / (df[tok] + 0.5))
+                    scores[tok][doc] += FIELD_WEIGHTS[field] * idf * freq * (BM25_K1 + 1) / (freq + norm)
+
+        self.postings = {tok: sorted(docs.items()) for tok, docs in scores.items()}
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """질의와 관련된 카드 id를 점수 내림차순으로 반환."""
+        acc: Dict[int, float] = defaultdict(float)
+        for tok in set(tokenize(query)):
+            for doc, score in self.postings.get(tok, ()):
+                acc[doc] += score
+        ranked = sorted(acc.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+        return [(self.ids[doc], round(score, 4)) for doc, score in ranked]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def main() -> None:
+    import argparse
+    import json
+    from pathlib import Path
+
+    ap = argparse.ArgumentParser(description="카드 의미 검색")
+    ap.add_argument("query")
+    ap.add_argument("--cards", default=str(Path(__file__).parent / "data" / "cards.json"))
+    ap.add_argument("-n", "--limit", type=int, default=10)
+    args = ap.parse_args()
+
+    with open(args.cards, "r", encoding="utf-8") as f:
+        cards = json.load(f)
+    by_id = {c["id"]: c for c in cards}
+    index = CardSearchIndex(cards)
+    for card_id, score in index.search(args.query, limit=args.limit):
+        c = by_id[card_id]
+        print(f"{score:8.3f}  {card_id:28s} {c.get('name_kr')} ({c.get('name_en')})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# spread_layout.py — 스프레드 배치도(한 장짜리 합성 이미지) 렌더러
+# -------------------------------------------------
+# - spreads.json 의 "layout": 포지션별 {x, y, rotate} (단위: 카드 한 칸 = 카드 크기 + 간격)
+#   · 켈틱 크로스: 십자(가로지르는 2번 카드는 90도) + 오른쪽 지팡이 4장
+#   · layout 이 없는 스프레드는 가로 한 줄로 배치
+# - 카드 앞면은 너비별 축소본(derivative)을 한 번만 만들어 재사용
+#   · JPEG 는 draft 모드로 축소 디코드 → 원본(약 1100×1900) 전체 디코드 생략
+#   · 메모리: 축소본 한 장 ≈ 너비² × 5.2 바이트(120px 75KB, 240px 300KB, 480px 1.2MB)
+#     → fitted_front 는 TAROT_DERIVATIVE_CACHE 장(기본 256)까지만 보관
+#       (기본 크기 78장 × 1x/2x 워밍업 ≈ 29MB)
+#   · 회전본(card_derivative)은 축소본을 돌리기만 해서(1ms 미만) 한 배치도 분량만 캐시
+# - 합성 결과와 카드 패널용 앞면(front_scaled)은 PIL 이미지로 돌려줌
+#   · 형식/품질/배율별 인코딩과 파일 캐시는 image_delivery.ImageStore 가 맡음
+#   · 정적 서빙이 꺼져 있을 때(st.image)는 JPEG 바이트로 캐시(front_jpeg, spread_jpeg)
+#     → st.image 가 크기·형식이 맞는 JPEG 는 다시 인코딩하지 않음
+#   → 원본 크기 이미지를 매 rerun 마다 다시 인코딩해 보내지 않음
+# -------------------------------------------------
+
+import os
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Optional
+
+from PIL import Image, ImageDraw, ImageOps
+
+CARD_ASPECT = 1920 / 1114          # 카드 앞면 세로/가로 비율(원본 평균)
+GAP_RATIO = 0.12                   # 카드 사이 간격(카드 너비 대비)
+MARGIN_RATIO = 0.15                # 바깥 여백(카드 너비 대비)
+BACKGROUND = (250, 250, 250)
+BADGE_FILL = (40, 40, 40)
+BADGE_TEXT = (255, 255, 255)
+JPEG_QUALITY = 85
+DERIVATIVE_CACHE = int(os.environ.get("TAROT_DERIVATIVE_CACHE", "256"))  # fitted_front 보관 장수
+
+# 위치 1칸: (x, y, 회전각)
+Slot = Tuple[float, float, int]
+
+
+def spread_slots(spread: Dict[str, Any], n_cards: int) -> Tuple[Slot, ...]:
+    """스프레드 정의 → 포지션별 배치 칸. layout 이 없거나 모자라면 가로로 이어 붙임."""
+    layout = (spread or {}).get("layout") or []
+    slots: List[Slot] = []
+    for i in range(n_cards):
+        if i < len(layout):
+            p = layout[i]
+            slots.append((float(p.get("x", i)), float(p.get("y", 0)), int(p.get("rotate", 0)) % 360))
+        else:
+            slots.append((float(i), 0.0, 0))
+    return tuple(slots)
+
+
+def card_size(card_width: int) -> Tuple[int, int]:
+    return card_width, round(card_width * CARD_ASPECT)
+
+
+@lru_cache(maxsize=64)
+def layout_geometry(slots: Tuple[Slot, ...], card_width: int) -> Tuple[Tuple[int, int], Tuple[Tuple[int, int, int, int], ...]]:
+    """배치 칸 → (캔버스 크기, 카드별 픽셀 상자(left, top, w, h)). 배치·너비별로 한 번만 계산."""
+    w, h = card_size(card_width)
+    gap = round(card_width * GAP_RATIO)
+    margin = round(card_width * MARGIN_RATIO)
+    step_x, step_y = w + gap, h + gap
+
+    boxes = []
+    for x, y, rot in slots:
+        cx, cy = (x + 0.5) * step_x, (y + 0.5) * step_y
+        bw, bh = (h, w) if rot in (90, 270) else (w, h)
+        boxes.append((cx - bw / 2, cy - bh / 2, bw, bh))
+
+    min_x = min(b[0] for b in boxes)
+    min_y = min(b[1] for b in boxes)
+    max_x = max(b[0] + b[2] for b in boxes)
+    max_y = max(b[1] + b[3] for b in boxes)
+    px = tuple((round(l - min_x) + margin, round(t - min_y) + margin, bw, bh) for l, t, bw, bh in boxes)
+    size = (round(max_x - min_x) + 2 * margin, round(max_y - min_y) + 2 * margin)
+    return size, px
+
+
+@lru_cache(maxsize=DERIVATIVE_CACHE)
+def fitted_front(path: str, card_width: int) -> Image.Image:
+    """앞면 축소본(정확히 카드 크기로 맞춤). 디코드는 경로/너비별로 한 번만."""
+    w, h = card_size(card_width)
+    with Image.open(path) as src:
+        if src.format == "JPEG":
+            src.draft("RGB", (w * 2, h * 2))
+        return ImageOps.fit(src.convert("RGB"), (w, h), Image.LANCZOS)
+
+
+@lru_cache(maxsize=32)
+def card_derivative(path: str, card_width: int, rotate: int = 0) -> Image.Image:
+    """축소본 + 회전. 각도가 달라도 디코드 없이 축소본만 돌림."""
+    img = fitted_front(path, card_width)
+    return img.rotate(rotate, expand=True) if rotate else img
+
+
+@lru_cache(maxsize=16)
+def front_scaled(path: str, width: int, rotate: int = 0) -> Image.Image:
+    """카드 패널용 앞면: 원본 비율 그대로 너비 width 로 축소 + 회전.
+    같은 크기를 형식별(WebP/대체 이미지)로 인코딩하는 동안만 쓰이므로 조금만 캐시."""
+    with Image.open(path) as src:
+        height = round(src.height * width / src.width)
+        if src.format == "JPEG":
+            src.draft("RGB", (width, height))
+        img = src.convert("RGB")
+        if img.width > width:
+            img = img.resize((width, height), Image.LANCZOS)
+    return img.rotate(rotate, expand=True) if rotate else img
+
+
+@lru_cache(maxsize=64)
+def front_jpeg(path: str, width: int, rotate: int = 0) -> bytes:
+    """front_scaled 를 JPEG 바이트로(st.image 용)."""
+    return _jpeg(front_scaled(path, width, rotate))
+
+
+def _jpeg(img: Image.Image) -> bytes:
+    buf = BytesIO()
+    img.save(buf, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
+def _draw_badge(canvas: Image.Image, box: Tuple[int, int, int, int], label: str) -> None:
+    left, top, bw, bh = box
+    r = max(9, min(bw, bh) // 10)
+    draw = ImageDraw.Draw(canvas)
+    cx, cy = left + r + 4, top + r + 4
+    draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=BADGE_FILL)
+    draw.text((cx, cy), label, fill=BADGE_TEXT, anchor="mm", font_size=round(r * 1.2))
+
+
+def render_spread_canvas(paths: Tuple[str, ...], reversed_flags: Tuple[bool, ...],
+                         slots: Tuple[Slot, ...], card_width: int) -> Image.Image:
+    """공개된 카드들을 배치도 한 장으로 합성. 아직 안 뽑힌 칸은 비워 둠."""
+    size, boxes = layout_geometry(slots, card_width)
+    canvas = Image.new("RGB", size, BACKGROUND)
+    for i, (path, rev) in enumerate(zip(paths, reversed_flags)):
+        rot = (slots[i][2] + (180 if rev else 0)) % 360
+        canvas.paste(card_derivative(path, card_width, rot), boxes[i][:2])
+        _draw_badge(canvas, boxes[i], str(i + 1))
+    return canvas
+
+
+@lru_cache(maxsize=64)
+def spread_jpeg(paths: Tuple[str, ...], reversed_flags: Tuple[bool, ...],
+                slots: Tuple[Slot, ...], card_width: int) -> bytes:
+    """배치도 합성 결과를 JPEG 바이트로(st.image 용)."""
+    return _jpeg(render_spread_canvas(paths, reversed_flags, slots, card_width))
+
+
+def spread_card_width(front_width: int) -> int:
+    """앱의 '앞면 이미지 크기' → 배치도 안 카드 한 장의 너비."""
+    return max(80, front_width * 3 // 5)
+
+
+def spread_canvas(image_paths: List[Path], reversed_flags: List[bool], spread: Dict[str, Any],
+                  card_width: int, n_positions: Optional[int] = None) -> Image.Image:
+    """스프레드 + 공개된 카드(앞쪽부터) → 합성 이미지."""
+    n = max(n_positions or 0, len(image_paths))
+    return render_spread_canvas(tuple(str(p) for p in image_paths), tuple(bool(r) for r in reversed_flags),
+                                spread_slots(spread, n), card_width)
+
+
+def spread_canvas_width(spread: Dict[str, Any], n_positions: int, card_width: int) -> int:
+    """합성 이미지의 픽셀 너비(표시 너비 계산용, 배치 계산은 캐시)."""
+    return layout_geometry(spread_slots(spread, n_positions), card_width)[0][0]
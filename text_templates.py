@@ -0,0 +1,200 @@
+# text_templates.py — 리딩 문장 템플릿 엔진
+# -------------------------------------------------
+# - 문장 틀은 data/templates.json 에 언어별로 분리(포지션 역할 머리말, 분위기 문구 등)
+# - 템플릿은 처음 한 번 '고정 조각 + 채울 칸' 목록으로 컴파일
+#   · 역할 머리말/정·역위 표기처럼 카드와 무관한 값은 컴파일 시 고정 조각에 합침
+#   · 기본 포지션 제목, 종합 해석 머리줄(메이저/마이너/역위/슈트 개수)도 언어별 틀
+#   · 엔진을 만들 때 모든 틀을 한 번 컴파일해 모르는 칸 이름/서식 지정자는 바로 ValueError
+#     → compile_engines() 가 통과하면 렌더링 중에 KeyError 가 나지 않음(핫 리로드 검증)
+# - render_many: 여러 리딩을 한 번에 — 리딩마다 조각 리스트를 한 번만 join
+# - 파일이 바뀌면 compile_engines() 로 새 묶음을 만든 뒤 set_engines() 로 통째 교체
+# -------------------------------------------------
+
+import json
+import threading
+from pathlib import Path
+from string import Formatter
+from typing import List, Dict, Any, Tuple, Optional, Iterable
+
+TEMPLATES_JSON = Path(__file__).parent / "data" / "templates.json"
+DEFAULT_LOCALE = "ko"
+
+MOOD_SUITS = ["wands", "cups", "swords", "pentacles"]
+MOOD_KEYS = ("major", "reversed", *MOOD_SUITS)
+ORIENTATIONS = ("upright", "reversed")
+
+# 틀마다 쓸 수 있는 칸 이름(고정 값으로 합쳐지는 칸 포함)
+POSITION_FIELDS = ("num", "title", "display", "text", "tail")
+POSITION_CONSTS = ("head", "meta")
+FLUENT_FIELDS = ("mood",)
+TITLE_FIELDS = ("num",)
+SUMMARY_FIELDS = ("majors", "minors", "reversed", *MOOD_SUITS)
+
+
+class CompiledTemplate:
+    """'{field}' 자리표시자 템플릿을 (고정 조각, 칸 이름) 튜플 목록으로 컴파일한 것."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, source: str, consts: Optional[Dict[str, str]] = None,
+                 fields: Optional[Iterable[str]] = None) -> None:
+        """fields 를 주면 그 밖의 칸 이름(consts 제외)은 ValueError."""
+        consts = consts or {}
+        allowed = None if fields is None else set(fields)
+        parts: List[Tuple[str, Optional[str]]] = []
+        literal = ""
+        for lit, field, spec, conv in Formatter().parse(source):
+            literal += lit
+            if field is None:
+                continue
+            if spec or conv:
+                raise ValueError(f"템플릿 서식 지정자는 지원하지 않습니다: {{{field}}}")
+            if allowed is not None and field not in consts and field not in allowed:
+                raise ValueError(f"템플릿에 알 수 없는 칸이 있습니다: {{{field}}}")
+            if field in consts:
+                # 고정 값은 앞뒤 조각과 합쳐 렌더링 시 append 횟수를 줄임
+                literal += consts[field]
+                continue
+            parts.append((literal, field))
+            literal = ""
+        parts.append((literal, None))
+        self.parts = tuple(parts)
+
+    def emit(self, out: List[str], values: Dict[str, str]) -> None:
+        for lit, field in self.parts:
+            if lit:
+                out.append(lit)
+            if field is not None:
+                out.append(values[field])
+
+    def __call__(self, **values: str) -> str:
+        out: List[str] = []
+        self.emit(out, values)
+        return "".join(out)
+
+
+class TemplateEngine:
+    """한 언어의 템플릿 묶음. 역할/정·역위 조합별 컴파일 결과를 캐시."""
+
+    def __init__(self, spec: Dict[str, Any]) -> None:
+        self.spec = spec
+        self.separator: str = spec.get("position_separator", "\n\n")
+        self.role_heads: Dict[str, str] = spec.get("role_heads", {})
+        self.meta: Dict[str, str] = spec["orientation_meta"]
+        self.fallback: Dict[str, str] = spec["fallback_text"]
+        self.endings = tuple(spec.get("sentence_endings", ()))
+        self.tail: str = spec.get("sentence_tail", "")
+        self.moods: Dict[str, str] = spec.get("moods", {})
+        self.mood_joiner: str = spec.get("mood_joiner", ", ")
+        self.mood_default: str = spec.get("mood_default", "")
+        self.fluent_tpl = CompiledTemplate(spec["fluent"], fields=FLUENT_FIELDS)
+        self.title_tpl = CompiledTemplate(spec["position_title"], fields=TITLE_FIELDS)
+        self.summary_tpl = CompiledTemplate(spec["summary_header"], fields=SUMMARY_FIELDS)
+        self._lines: Dict[Tuple[str, bool], CompiledTemplate] = {}
+        # 렌더링 때 찾는 키와 포지션 틀을 지금 확인(역할별 컴파일은 처음 쓸 때)
+        missing = [f"orientation_meta.{k}" for k in ORIENTATIONS if k not in self.meta]
+        missing += [f"fallback_text.{k}" for k in ORIENTATIONS if k not in self.fallback]
+        missing += [f"moods.{k}" for k in MOOD_KEYS if k not in self.moods]
+        if missing:
+            raise KeyError(f"템플릿 키가 없습니다: {', '.join(missing)}")
+        CompiledTemplate(spec["position_line"], dict.fromkeys(POSITION_CONSTS, ""), POSITION_FIELDS)
+        self._lock = threading.Lock()
+
+    # ---- 포지션 문장 ----
+    def _line_template(self, role: str, reversed_: bool) -> CompiledTemplate:
+        key = (role, reversed_)
+        tpl = self._lines.get(key)
+        if tpl is None:
+            tpl = CompiledTemplate(self.spec["position_line"], {
+                "head": self.role_heads.get(role, ""),
+                "meta": self.meta["reversed" if reversed_ else "upright"],
+            }, POSITION_FIELDS)
+            with self._lock:
+                self._lines[key] = tpl
+        return tpl
+
+    def emit_position_line(self, out: List[str], i: int, piece: Dict[str, Any],
+                           pos: Dict[str, Any], text: str) -> None:
+        rev = piece["reversed"]
+        if not text:
+            text = self.fallback["reversed" if rev else "upright"]
+        self._line_template((pos.get("role") or "").lower(), rev).emit(out, {
+            "num": str(i + 1),
+            "title": pos.get("title") or self.title_tpl(num=str(i + 1)),
+            "display": piece["display"],
+            "text": text,
+            "tail": "" if text.endswith(self.endings) else self.tail,
+        })
+
+    def emit_story(self, out: List[str], items: Iterable[Tuple[Dict[str, Any], Dict[str, Any], str]]) -> None:
+        """items: (조각, 포지션 정의, 포커스 문장) 순서열 → 포지션별 스토리 전체."""
+        for i, (piece, pos, text) in enumerate(items):
+            if i:
+                out.append(self.separator)
+            self.emit_position_line(out, i, piece, pos, text)
+
+    # ---- 한두 줄 요약 ----
+    def mood_text(self, n: int, majors: int, reversed_cnt: int, suits: Dict[str, int]) -> str:
+        mood = []
+        if majors >= max(1, n//2): mood.append(self.moods["major"])
+        if reversed_cnt >= max(1, n//3): mood.append(self.moods["reversed"])
+        for s in MOOD_SUITS:
+            if suits[s] >= 2: mood.append(self.moods[s])
+        return self.mood_joiner.join(mood) if mood else self.mood_default
+
+    def summary_header(self, n: int, majors: int, reversed_cnt: int, suits: Dict[str, int]) -> str:
+        return self.summary_tpl(majors=str(majors), minors=str(n - majors), reversed=str(reversed_cnt),
+                                **{s: str(suits[s]) for s in MOOD_SUITS})
+
+    def emit_fluent(self, out: List[str], mood: str, lines: List[str]) -> None:
+        self.fluent_tpl.emit(out, {"mood": mood})
+        second = " ".join(lines).replace("  ", " ").strip()
+        if second:
+            out.append(" ")
+            out.append(second)
+
+    # ---- 일괄 렌더링 ----
+    def render_many(self, readings: Iterable[Iterable[Tuple[Dict[str, Any], Dict[str, Any], str]]]) -> List[str]:
+        """여러 리딩의 포지션별 스토리를 한 번에. 리딩마다 join 은 한 번뿐."""
+        results: List[str] = []
+        out: List[str] = []
+        for items in readings:
+            self.emit_story(out, items)
+            results.append("".join(out))
+            out.clear()
+        return results
+
+
+_ENGINES: Dict[str, TemplateEngine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def load_templates(path: Path = TEMPLATES_JSON) -> Dict[str, Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compile_engines(path: Path = TEMPLATES_JSON) -> Dict[str, TemplateEngine]:
+    """템플릿 파일 전체를 언어별 엔진으로 컴파일. 필수 키가 빠졌으면 KeyError, 틀이 잘못됐으면 ValueError."""
+    engines = {loc: TemplateEngine(spec) for loc, spec in load_templates(path).items()}
+    if DEFAULT_LOCALE not in engines:
+        raise KeyError(f"기본 언어 템플릿이 없습니다: {DEFAULT_LOCALE}")
+    return engines
+
+
+def set_engines(engines: Dict[str, TemplateEngine]) -> None:
+    """미리 컴파일한 엔진 묶음으로 교체(참조 하나만 바꾸므로 렌더링 중인 쪽은 기존 묶음을 씀)."""
+    global _ENGINES
+    _ENGINES = engines
+
+
+def get_engine(locale: str = DEFAULT_LOCALE) -> TemplateEngine:
+    """언어별 엔진(처음 요청 시 컴파일). 템플릿이 없는 언어는 기본 언어로."""
+    engines = _ENGINES
+    engine = engines.get(locale)
+    if engine is not None:
+        return engine
+    with _ENGINES_LOCK:
+        if not _ENGINES:
+            set_engines(compile_engines())
+        return _ENGINES.get(locale) or _ENGINES[DEFAULT_LOCALE]
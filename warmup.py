@@ -0,0 +1,103 @@
+# warmup.py — 앱 프로세스 워밍업 + 첫 화면 시간 보고
+# -------------------------------------------------
+# - 그리드에 꼭 필요한 것(기본 덱 카탈로그·검색 색인, 기본 너비 뒷면 썸네일)은 첫 실행이 그대로 만들고,
+#   첫 화면을 다 그린 뒤 나머지를 백그라운드 스레드 하나가 미리 채움
+#   · 기본 크기 앞면 축소본(78장 × 배율), 스프레드별 배치 계산
+#     - 회전본은 축소본을 돌리기만 하면 되므로(1ms 미만) 미리 만들지 않음
+#       → 각도마다 보관하면 1x/2x 기준 약 116MB, 축소본만이면 약 29MB
+#     - 축소본 캐시 상한(spread_layout.DERIVATIVE_CACHE)을 넘는 만큼은 채우지 않음
+#   · 슬라이더의 다른 너비 뒷면 썸네일, 역할별 문장 템플릿, 오늘의 카드 표
+#   → 사용자가 카드를 고르는 동안 캐시가 데워져, 첫 공개부터 디코드/리사이즈 없음
+# - 첫 화면까지 걸린 시간(모듈 가져오기 포함)과 워밍업 단계별 시간을 한 줄로 로그(INFO)
+# -------------------------------------------------
+
+import logging
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple, Callable, Sequence
+
+from deck_registry import Deck
+from reading import FOCUS_KEYS, build_position_stories
+from spread_layout import DERIVATIVE_CACHE, fitted_front, layout_geometry, spread_slots
+
+log = logging.getLogger(__name__)
+
+Task = Tuple[str, Callable[[], Any]]
+
+
+class Warmup:
+    """프로세스당 하나. 첫 실행 시각 기록 → 첫 화면 완료 보고 → 백그라운드 워밍업."""
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, float] = {}     # 단계 → ms
+        self.import_ms: Optional[float] = None
+        self.first_render_ms: Optional[float] = None
+        self.done = threading.Event()
+        self._t0: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def begin(self, script_t0: float, import_ms: float) -> None:
+        """매 실행 맨 앞에서 호출. 기록은 프로세스의 첫 실행 것만."""
+        with self._lock:
+            if self._t0 is None:
+                self._t0, self.import_ms = script_t0, import_ms
+
+    def mark_first_render(self) -> bool:
+        """첫 화면을 다 그렸을 때 호출. 처음 한 번만 True."""
+        with self._lock:
+            if self.first_render_ms is not None or self._t0 is None:
+                return False
+            self.first_render_ms = (time.perf_counter() - self._t0) * 1000
+        log.info("첫 화면 %.0fms (모듈 가져오기 %.0fms)", self.first_render_ms, self.import_ms)
+        return True
+
+    def start(self, tasks: List[Task], prepare: Optional[Callable[[threading.Thread], Any]] = None) -> None:
+        """tasks 를 순서대로 백그라운드에서 실행. prepare 는 시작 전 스레드에 적용(예: 스크립트 컨텍스트)."""
+        thread = threading.Thread(target=self._run, args=(tasks,), name="warmup", daemon=True)
+        if prepare is not None:
+            prepare(thread)
+        thread.start()
+
+    def _run(self, tasks: List[Task]) -> None:
+        t_all = time.perf_counter()
+        for name, fn in tasks:
+            t = time.perf_counter()
+            try:
+                fn()
+            except Exception:
+                # 워밍업 실패는 캐시가 덜 데워질 뿐 — 요청 처리에는 영향 없음
+                log.exception("워밍업 '%s' 실패", name)
+            self.timings[name] = (time.perf_counter() - t) * 1000
+        self.done.set()
+        steps = ", ".join(f"{k} {v:.0f}ms" for k, v in self.timings.items())
+        log.info("백그라운드 워밍업 %.0fms (%s)", (time.perf_counter() - t_all) * 1000, steps)
+
+
+# ========================= 워밍업 작업 =========================
+def derivative_tasks(deck: Deck, spreads: Dict[str, Dict[str, Any]], card_widths: Sequence[int]) -> List[Task]:
+    """배치도에 쓰이는 앞면 축소본(너비별)과 스프레드별 배치 계산. 축소본은 캐시 상한까지만."""
+    slots = [spread_slots(sp, len(sp["positions"])) for sp in spreads.values()]
+    paths = [str(deck.image_index[c["id"]]) for c in deck.cards if c["id"] in deck.image_index]
+    jobs = [(path, card_width) for card_width in card_widths for path in paths][:DERIVATIVE_CACHE]
+
+    def fronts() -> None:
+        for path, card_width in jobs:
+            fitted_front(path, card_width)
+
+    def layouts() -> None:
+        for card_width in card_widths:
+            for sl in slots:
+                layout_geometry(sl, card_width)
+
+    return [("배치 계산", layouts), ("앞면 축소본", fronts)]
+
+
+def warm_templates(deck: Deck, spreads: Dict[str, Dict[str, Any]]) -> None:
+    """스프레드마다 포지션 역할 × 정/역위 문장 틀을 한 번씩 컴파일."""
+    readings = []
+    for sp in spreads.values():
+        n = len(sp["positions"])
+        for parity in (0, 1):
+            cards = [{**c, "is_reversed": i % 2 == parity} for i, c in enumerate(deck.cards[:n])]
+            readings.extend((cards, sp, f) for f in FOCUS_KEYS)
+    build_position_stories(readings, locale=deck.locale)